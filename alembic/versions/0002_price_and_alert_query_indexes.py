@@ -0,0 +1,36 @@
+"""price and alert query indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 21:15:06.689634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_price_date_desc', 'prices', [sa.text('date DESC')], unique=False)
+    op.create_index('idx_alert_pending', 'alerts', ['crop_id', 'market_id'], unique=False, postgresql_where=sa.text('last_sent_at IS NULL'))
+    op.drop_index('idx_price_crop_id', table_name='prices')
+    op.drop_index('idx_price_date', table_name='prices')
+    op.drop_index('idx_price_market_id', table_name='prices')
+    op.drop_index('ix_prices_date', table_name='prices')
+
+
+def downgrade() -> None:
+    op.create_index('ix_prices_date', 'prices', ['date'], unique=False)
+    op.create_index('idx_price_market_id', 'prices', ['market_id'], unique=False)
+    op.create_index('idx_price_date', 'prices', ['date'], unique=False)
+    op.create_index('idx_price_crop_id', 'prices', ['crop_id'], unique=False)
+    op.drop_index('idx_alert_pending', table_name='alerts', postgresql_where=sa.text('last_sent_at IS NULL'))
+    op.drop_index('idx_price_date_desc', table_name='prices')
+
+
@@ -0,0 +1,35 @@
+"""server side defaults for language, is_admin and created_at
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 21:21:40.512318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('language', existing_type=sa.String(length=10), existing_nullable=False, server_default='en')
+        # Render the dialect's boolean literal; the quoted 'false' string is truthy on SQLite
+        batch_op.alter_column('is_admin', existing_type=sa.Boolean(), existing_nullable=False, server_default=sa.false())
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=sa.func.now())
+    with op.batch_alter_table('alerts') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('alerts') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=None)
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=None)
+        batch_op.alter_column('is_admin', existing_type=sa.Boolean(), existing_nullable=False, server_default='false')
+        batch_op.alter_column('language', existing_type=sa.String(length=10), existing_nullable=False, server_default=None)
@@ -0,0 +1,66 @@
+"""latest prices materialized view
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 21:31:12.204815
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Materialized views are PostgreSQL only; other databases compute the
+    # latest prices on read (see PriceService.get_latest_prices_with_details)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW latest_prices_with_trend AS
+        SELECT DISTINCT ON (p.crop_id, p.market_id)
+            p.id,
+            p.crop_id,
+            p.market_id,
+            c.name AS crop_name,
+            c.crop_type,
+            m.name AS market_name,
+            m.region AS market_region,
+            p.price,
+            p.date AS price_date,
+            COALESCE(p.price - (
+                SELECT prev.price
+                FROM prices prev
+                WHERE prev.crop_id = p.crop_id
+                  AND prev.market_id = p.market_id
+                  AND prev.date <= p.date - 7
+                ORDER BY prev.date DESC
+                LIMIT 1
+            ), 0) AS price_change_7d
+        FROM prices p
+        JOIN crops c ON c.id = p.crop_id
+        JOIN markets m ON m.id = p.market_id
+        ORDER BY p.crop_id, p.market_id, p.date DESC
+    """)
+    # REFRESH ... CONCURRENTLY requires a unique index on the view
+    op.execute(
+        "CREATE UNIQUE INDEX idx_latest_prices_crop_market "
+        "ON latest_prices_with_trend (crop_id, market_id)"
+    )
+    op.execute(
+        "CREATE INDEX idx_latest_prices_date "
+        "ON latest_prices_with_trend (price_date DESC)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS latest_prices_with_trend")
@@ -0,0 +1,51 @@
+"""covering crop/market/date index on prices
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 21:38:47.118209
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; build the new index
+    # before dropping the old one so lookups are never left unindexed
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_price_crop_market_latest',
+            'prices',
+            ['crop_id', 'market_id', sa.text('date DESC')],
+            unique=False,
+            postgresql_include=['price'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_price_crop_market_date',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_price_crop_market_date',
+            'prices',
+            ['crop_id', 'market_id', 'date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_price_crop_market_latest',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
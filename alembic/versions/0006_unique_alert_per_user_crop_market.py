@@ -0,0 +1,37 @@
+"""unique alert per user, crop and market
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 21:52:09.630114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicates could slip past the old SELECT-then-INSERT check under
+    # concurrent requests; keep the oldest alert of each group
+    op.execute("""
+        DELETE FROM alerts
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM alerts GROUP BY user_id, crop_id, market_id
+        )
+    """)
+    with op.batch_alter_table('alerts') as batch_op:
+        batch_op.create_unique_constraint('uq_alert_user_crop_market', ['user_id', 'crop_id', 'market_id'])
+        # The unique constraint's index covers the same columns
+        batch_op.drop_index('idx_alert_user_crop_market')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('alerts') as batch_op:
+        batch_op.create_index('idx_alert_user_crop_market', ['user_id', 'crop_id', 'market_id'], unique=False)
+        batch_op.drop_constraint('uq_alert_user_crop_market', type_='unique')
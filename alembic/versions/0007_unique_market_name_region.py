@@ -0,0 +1,62 @@
+"""unique market per name and region
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 22:31:40.512876
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+# Oldest market with the same name and region as markets.id = {column}
+KEEPER = """
+    (SELECT MIN(k.id) FROM markets k
+     JOIN markets m ON k.name = m.name AND k.region = m.region
+     WHERE m.id = {column})
+"""
+DUPLICATE_MARKETS = "SELECT id FROM markets WHERE id NOT IN (SELECT MIN(id) FROM markets GROUP BY name, region)"
+
+
+def upgrade() -> None:
+    # Duplicates could slip past the old SELECT-then-INSERT check under
+    # concurrent requests; merge each group into its oldest market.
+    # Alerts that would collide with another alert of the same user and
+    # crop once merged are dropped first, keeping the oldest; grouping on
+    # the merged market covers twins on the keeper market itself.
+    op.execute(f"""
+        DELETE FROM alerts
+        WHERE id NOT IN (
+            SELECT MIN(merged.id) FROM (
+                SELECT a.id, a.user_id, a.crop_id,
+                       {KEEPER.format(column='a.market_id')} AS market_id
+                FROM alerts a
+            ) merged
+            GROUP BY merged.user_id, merged.crop_id, merged.market_id
+        )
+    """)
+    for table in ('alerts', 'prices'):
+        op.execute(f"""
+            UPDATE {table}
+            SET market_id = {KEEPER.format(column=f'{table}.market_id')}
+            WHERE market_id IN ({DUPLICATE_MARKETS})
+        """)
+    op.execute(f"DELETE FROM markets WHERE id IN ({DUPLICATE_MARKETS})")
+
+    with op.batch_alter_table('markets') as batch_op:
+        batch_op.create_unique_constraint('uq_market_name_region', ['name', 'region'])
+        # The unique constraint's index covers the same columns
+        batch_op.drop_index('idx_market_name_region')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('markets') as batch_op:
+        batch_op.create_index('idx_market_name_region', ['name', 'region'], unique=False)
+        batch_op.drop_constraint('uq_market_name_region', type_='unique')
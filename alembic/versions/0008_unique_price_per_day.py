@@ -0,0 +1,74 @@
+"""unique price per crop, market and date
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 22:48:26.304117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicates could slip past the old SELECT-then-INSERT check under
+    # concurrent requests, or come from markets merged by 0007; keep the
+    # oldest price of each group
+    op.execute("""
+        DELETE FROM prices
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM prices GROUP BY crop_id, market_id, date
+        )
+    """)
+    # Make the covering crop/market/date index unique instead of adding a
+    # second index on the same columns; its leading column also makes the
+    # single-column crop_id index redundant
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_price_crop_market_date',
+            'prices',
+            ['crop_id', 'market_id', sa.text('date DESC')],
+            unique=True,
+            postgresql_include=['price'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_price_crop_market_latest',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_prices_crop_id',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_prices_crop_id',
+            'prices',
+            ['crop_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_price_crop_market_latest',
+            'prices',
+            ['crop_id', 'market_id', sa.text('date DESC')],
+            unique=False,
+            postgresql_include=['price'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'uq_price_crop_market_date',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
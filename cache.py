@@ -0,0 +1,104 @@
+"""
+Redis-backed cache for short-lived API responses.
+"""
+import logging
+from typing import Any, Optional
+
+import orjson
+import redis
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+ADMIN_STATS_CACHE_KEY = "admin:stats"
+CROPS_CACHE_KEY = "crops:all"
+MARKETS_CACHE_KEY = "markets:all"
+
+# Cache key prefixes for responses that vary by query parameters
+PRICES_CACHE_PREFIX = "prices:"
+
+# Shared Redis client (defaults to the Celery broker instance)
+redis_client = redis.Redis.from_url(
+    settings.CACHE_REDIS_URL or settings.CELERY_BROKER_URL,
+    socket_connect_timeout=settings.CACHE_SOCKET_TIMEOUT,
+    socket_timeout=settings.CACHE_SOCKET_TIMEOUT,
+)
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """
+    Get a cached value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Decoded value, or None on a miss or when the cache is unavailable
+    """
+    if not settings.CACHE_ENABLED:
+        return None
+
+    try:
+        cached = redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+    if cached is None:
+        return None
+    return orjson.loads(cached)
+
+
+def cache_set(key: str, value: Any, ttl: int) -> None:
+    """
+    Store a JSON-serializable value in the cache.
+    Dates and datetimes are encoded as ISO 8601 strings.
+
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Time to live in seconds
+    """
+    if not settings.CACHE_ENABLED:
+        return
+
+    try:
+        redis_client.set(key, orjson.dumps(value), ex=ttl)
+    except redis.RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+def cache_delete(*keys: str) -> None:
+    """
+    Remove keys from the cache.
+
+    Args:
+        keys: Cache keys to delete
+    """
+    if not settings.CACHE_ENABLED or not keys:
+        return
+
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Cache delete failed for %s: %s", keys, e)
+
+
+def cache_delete_prefix(prefix: str) -> None:
+    """
+    Remove every key starting with a prefix.
+
+    Args:
+        prefix: Cache key prefix
+    """
+    if not settings.CACHE_ENABLED:
+        return
+
+    try:
+        keys = list(redis_client.scan_iter(match=f"{prefix}*", count=500))
+        if keys:
+            redis_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Cache delete failed for %s*: %s", prefix, e)
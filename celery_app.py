@@ -21,6 +21,9 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # Task modules are imported by worker processes only; web processes
+    # enqueue by name with celery_app.send_task("tasks.<name>")
+    imports=("tasks",),
 )
 
 # Schedule periodic tasks
@@ -30,22 +33,3 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(hour=9, minute=0),  # Run daily at 9:00 AM UTC
     },
 }
-
-# Import tasks
-from tasks import check_price_alerts  # noqa: F401, E402
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
@@ -10,11 +10,22 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    PGBOUNCER_URL: Optional[str] = None  # Transaction-pooling PgBouncer; disables the in-process pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a pooled connection
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a connection is recycled
+    DB_CONNECT_TIMEOUT: int = 5  # Seconds to wait when opening a connection
     
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = 12  # bcrypt cost factor; each +1 doubles hashing time
+    OTP_VERIFICATION_ENABLED: bool = False  # Set to True to require a valid OTP at login
+    OTP_TTL_SECONDS: int = 300  # Seconds an issued OTP stays valid
+    OTP_MAX_ATTEMPTS: int = 5  # Wrong guesses before an issued OTP is discarded
+    OTP_RESEND_COOLDOWN_SECONDS: int = 60  # Seconds before another OTP can be sent to a number
     
     # Application
     ENVIRONMENT: str = "development"
@@ -22,16 +33,30 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api/v1"
     FRONTEND_URL: Optional[str] = None  # Frontend URL for CORS (e.g., "http://localhost:3000")
     PORT: int = 8080  # Server port (can be overridden by PORT env var for deployment)
+    LOG_LEVEL: str = "INFO"
+    SQL_ECHO: bool = False  # Log every SQL statement (sqlalchemy.engine at INFO)
+    SLOW_REQUEST_THRESHOLD: float = 0.5  # Seconds; slower requests are logged
     
     # Twilio SMS
     TWILIO_ACCOUNT_SID: Optional[str] = None
     TWILIO_AUTH_TOKEN: Optional[str] = None
     TWILIO_PHONE_NUMBER: Optional[str] = None
     SMS_ENABLED: bool = False  # Set to True to enable SMS sending
+    SMS_MAX_WORKERS: int = 10  # Concurrent SMS sends during an alert check
+    SMS_TIMEOUT: float = 10.0  # Seconds before a Twilio API request gives up
+    SMS_RATE_LIMIT_RETRIES: int = 3  # Retries after a Twilio 429, with exponential backoff
     
     # Celery (optional, defaults to Redis)
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/0"
+    LATEST_PRICES_REFRESH_DELAY: int = 30  # Seconds price writes are batched into one latest-prices view refresh
+    
+    # Response cache (optional, Redis)
+    CACHE_ENABLED: bool = False  # Set to True to cache hot read endpoints
+    CACHE_REDIS_URL: Optional[str] = None  # Defaults to CELERY_BROKER_URL
+    CACHE_SOCKET_TIMEOUT: float = 0.5  # Seconds before a cache call gives up
+    ADMIN_STATS_CACHE_TTL: int = 30
+    PUBLIC_CACHE_TTL: int = 60  # Seconds public GET responses (crops, markets, prices) are cached
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,35 @@
+"""
+CORS origin allow-list.
+"""
+from typing import FrozenSet
+
+from config import settings
+
+# Note: Cannot use allow_origins=["*"] with allow_credentials=True
+# So we allow common development origins explicitly
+_DEFAULT_ORIGINS = (
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:3001",
+    "https://gebeya-alert.vercel.app",
+    "https://gebeya-alert-qpqh2rn6z-tinsaes-projects-7b3f74ab.vercel.app",  # current preview
+)
+
+
+def _build_allowed_origins() -> FrozenSet[str]:
+    """Combine the default origins with the configured frontend URL."""
+    origins = set(_DEFAULT_ORIGINS)
+
+    # Add frontend URL from config if specified (for production),
+    # both as given and without a trailing slash
+    if settings.FRONTEND_URL:
+        origins.add(settings.FRONTEND_URL)
+        origins.add(settings.FRONTEND_URL.rstrip('/'))
+
+    return frozenset(origins)
+
+
+# Built once at import; CORSMiddleware checks membership with `in`,
+# so a frozenset makes every origin match a hash lookup
+ALLOWED_ORIGINS: FrozenSet[str] = _build_allowed_origins()
@@ -1,48 +1,129 @@
 """
 Database configuration and session management.
 """
-from sqlmodel import SQLModel, Session, create_engine
-from typing import Generator
+from sqlmodel import Session, create_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload, sessionmaker, scoped_session
+from sqlalchemy.pool import NullPool
+from typing import Generator, List
 
 from config import settings
 
+# Connection timeouts are driver specific; only PostgreSQL understands these
+connect_args = {}
+if settings.DATABASE_URL.startswith("postgres"):
+    connect_args = {
+        "connect_timeout": settings.DB_CONNECT_TIMEOUT,
+        "options": "-c jit=off",
+    }
+
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+if settings.PGBOUNCER_URL:
+    # PgBouncer (transaction pooling) multiplexes connections, so keep no
+    # pool in-process. psycopg2 never uses server-side prepared statements,
+    # which keeps it compatible with transaction pooling. PgBouncer rejects
+    # the "options" startup parameter, so only the timeout is passed.
+    engine = create_engine(
+        settings.PGBOUNCER_URL,
+        poolclass=NullPool,
+        connect_args={"connect_timeout": settings.DB_CONNECT_TIMEOUT},
+    )
+else:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        # Reuse the most recently returned connection first so a burst's
+        # extra connections go idle and age out instead of being rotated
+        pool_use_lifo=True,
+        connect_args=connect_args,
+    )
+
+# Session factory shared by request handlers, scripts and background tasks
+SessionLocal = sessionmaker(
+    bind=engine,
+    class_=Session,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
+# Thread-local session registry for long-lived workers (e.g. Celery)
+ScopedSession = scoped_session(SessionLocal)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
     Yields a database session and closes it after use.
     """
-    session = None
+    session = SessionLocal()
     try:
-        session = Session(engine)
         yield session
     except Exception:
         # Rollback on any exception
-        if session:
-            session.rollback()
+        session.rollback()
         raise
     finally:
-        if session:
-            session.close()
+        session.close()
 
 
-def init_db() -> None:
+def insert_ignoring_conflicts(db: Session, model, index_elements, rows: List[dict]) -> list:
     """
-    Initialize database by creating all tables.
-    Should be called after all models are imported.
+    Insert rows, skipping any that would violate a unique constraint.
+    Letting the database reject duplicates is race-free, unlike checking
+    with a SELECT first, and saves that extra round trip.
+    
+    PostgreSQL and SQLite do this in one INSERT ... ON CONFLICT DO NOTHING
+    RETURNING statement. Other databases insert row by row, each inside a
+    SAVEPOINT, and skip rows that raise IntegrityError.
+    
+    Args:
+        db: Database session
+        model: Table model to insert into
+        index_elements: Columns of the unique index to conflict on
+        rows: Column values keyed by model attribute name
+        
+    Returns:
+        The created rows as model instances; skipped rows are left out
     """
-    # Import all models here so they're registered with SQLModel
-    from models import User, Crop, Market, Price, Alert, NotificationLog  # noqa: F401
+    if not rows:
+        return []
     
-    SQLModel.metadata.create_all(engine)
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = (
+            dialect_insert(model)
+            .on_conflict_do_nothing(index_elements=index_elements)
+            .returning(model)
+        )
+        return list(db.scalars(statement, rows))
+    
+    created = []
+    for row in rows:
+        instance = model(**row)
+        try:
+            with db.begin_nested():
+                db.add(instance)
+        except IntegrityError:
+            continue
+        created.append(instance)
+    return created
 
 
+def lazy_load_guard() -> tuple:
+    """
+    Loader options that make unplanned relationship lazy loads raise
+    outside production, so N+1 regressions fail loudly in development.
+    Pass after a query's explicit eager-load options.
+    
+    Returns:
+        Options to unpack into .options(); empty in production
+    """
+    if settings.ENVIRONMENT == "production":
+        return ()
+    return (raiseload("*"),)
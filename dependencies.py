@@ -1,10 +1,15 @@
 """
 FastAPI dependencies for authentication and database access.
 """
+import hashlib
+import time
+from dataclasses import dataclass
+from threading import Lock
 from typing import Optional
+from cachetools import TLRUCache, TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from database import get_db
 from utils.jwt import verify_token
@@ -17,13 +22,56 @@ oauth2_scheme = OAuth2PasswordBearer(
     auto_error=False
 )
 
+# Seconds a loaded user is reused before it is read from the database again
+USER_CACHE_TTL = 60
 
-def get_current_user_id(
-    token: Optional[str] = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> Optional[int]:
+# Seconds a verified token payload is reused before the signature is checked again
+TOKEN_CACHE_TTL = 30
+
+
+def _token_cache_expiry(key: str, payload: dict, now: float) -> float:
+    """Expire a cached payload after TOKEN_CACHE_TTL or at its "exp" claim, whichever is first."""
+    expires = now + TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        expires = min(expires, exp)
+    return expires
+
+
+# Decoded JWT payloads keyed by a digest of the token. Only valid tokens
+# are cached, and the wall clock is used so "exp" can bound the lifetime.
+_token_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_cache_expiry, timer=time.time)
+_token_cache_lock = Lock()
+
+# Detached copies of authenticated users keyed by user ID. The copies belong
+# to no session, so concurrent requests can share them read-only.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=USER_CACHE_TTL)
+_user_cache_lock = Lock()
+
+
+def _verify_token_cached(token: str) -> Optional[dict]:
     """
-    Dependency to get current authenticated user ID from JWT token.
+    Verify a JWT token, reusing the decoded payload for repeat tokens.
+    
+    Returns:
+        Decoded token payload if valid, None otherwise
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+    
+    payload = verify_token(token)
+    if payload is not None:
+        with _token_cache_lock:
+            _token_cache[key] = payload
+    return payload
+
+
+def _user_id_from_token(token: Optional[str]) -> Optional[int]:
+    """
+    Extract the user ID from a JWT token.
     
     Returns:
         User ID if token is valid, None otherwise
@@ -31,7 +79,7 @@ def get_current_user_id(
     if not token:
         return None
     
-    payload = verify_token(token)
+    payload = _verify_token_cached(token)
     if payload is None:
         return None
     
@@ -45,9 +93,70 @@ def get_current_user_id(
         return None
 
 
-def get_current_user(
+# Dependencies that do no blocking I/O are async so FastAPI calls them on the
+# event loop instead of dispatching each one to the threadpool. _resolve_auth
+# and get_db touch the database and stay synchronous.
+async def get_current_user_id(
+    token: Optional[str] = Depends(oauth2_scheme)
+) -> Optional[int]:
+    """
+    Dependency to get current authenticated user ID from JWT token.
+    
+    Returns:
+        User ID if token is valid, None otherwise
+    """
+    return _user_id_from_token(token)
+
+
+@dataclass
+class AuthContext:
+    """Authentication state resolved once per request."""
+    user_id: Optional[int] = None
+    user: Optional[User] = None
+
+
+def _resolve_auth(
     token: Optional[str] = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
+) -> AuthContext:
+    """
+    Dependency that decodes the JWT token and loads the user in one step.
+    
+    Returns:
+        AuthContext with user ID and User object (both None if unauthenticated)
+    """
+    user_id = _user_id_from_token(token)
+    if user_id is None:
+        return AuthContext()
+    
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    
+    if user is None:
+        db_user = db.get(User, user_id)
+        if db_user is None:
+            return AuthContext(user_id=user_id)
+        user = User(**db_user.model_dump())
+        with _user_cache_lock:
+            _user_cache[user_id] = user
+    
+    return AuthContext(user_id=user_id, user=user)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a user from the authentication cache.
+    Call after changing a user so the next request reloads it.
+    
+    Args:
+        user_id: User ID
+    """
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+async def get_current_user(
+    auth: AuthContext = Depends(_resolve_auth)
 ) -> Optional[User]:
     """
     Dependency to get current authenticated user from JWT token.
@@ -55,16 +164,10 @@ def get_current_user(
     Returns:
         User object if token is valid, None otherwise
     """
-    user_id = get_current_user_id(token, db)
-    if user_id is None:
-        return None
-    
-    statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
-    return user
+    return auth.user
 
 
-def require_auth(
+async def require_auth(
     current_user_id: Optional[int] = Depends(get_current_user_id)
 ) -> int:
     """
@@ -83,7 +186,7 @@ def require_auth(
     return current_user_id
 
 
-def require_user(
+async def require_user(
     current_user: Optional[User] = Depends(get_current_user)
 ) -> User:
     """
@@ -102,7 +205,7 @@ def require_user(
     return current_user
 
 
-def require_admin(
+async def require_admin(
     current_user: User = Depends(require_user)
 ) -> User:
     """
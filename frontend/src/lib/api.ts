@@ -150,8 +150,18 @@ class ApiClient {
 
   // Alert endpoints
   async getAlerts() {
-    const response = await this.client.get('/alerts')
-    return response.data
+    // The endpoint is keyset-paginated; follow X-Next-Cursor until the
+    // last page so users with many alerts still see all of them
+    const alerts = []
+    let beforeId: string | undefined
+    do {
+      const response = await this.client.get('/alerts', {
+        params: { limit: 200, before_id: beforeId }
+      })
+      alerts.push(...response.data)
+      beforeId = response.headers['x-next-cursor']
+    } while (beforeId)
+    return alerts
   }
 
   async createAlert(data: {
@@ -0,0 +1,57 @@
+"""
+Logging configuration.
+
+Records are pushed onto an in-memory queue by the request threads and
+written to stderr by a background listener thread.
+"""
+import atexit
+import logging
+import logging.config
+import queue
+from logging.handlers import QueueListener
+
+from config import settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+_listener = None
+
+
+def configure_logging() -> None:
+    """
+    Configure application logging with a queue-backed handler.
+    Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "queue": {
+                "class": "logging.handlers.QueueHandler",
+                "queue": log_queue,
+            },
+        },
+        "loggers": {
+            # Statement logging goes through the queue instead of engine echo
+            "sqlalchemy.engine": {
+                "level": "INFO" if settings.SQL_ECHO else "WARNING",
+            },
+        },
+        "root": {
+            "level": settings.LOG_LEVEL,
+            "handlers": ["queue"],
+        },
+    })
+
+    _listener = QueueListener(log_queue, console_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -3,15 +3,23 @@ GebeyaAlert - Main FastAPI application entry point.
 """
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
+from sqlmodel import text
+import logging
 import traceback
 import time
 
 from config import settings
-from database import init_db
+from cors import ALLOWED_ORIGINS
+from database import engine
+from logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -19,71 +27,49 @@ app = FastAPI(
     description="Production-ready alert system",
     version="1.0.0",
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware - Fixed to properly handle frontend requests
-# Note: Cannot use allow_origins=["*"] with allow_credentials=True
-# So we allow common development origins explicitly
-allowed_origins = [
-    "http://localhost:3000",
-    "http://localhost:3001",
-    "http://127.0.0.1:3000",
-    "http://127.0.0.1:3001",
-    "https://gebeya-alert.vercel.app",
-    "https://gebeya-alert.vercel.app", 
-    "https://gebeya-alert-qpqh2rn6z-tinsaes-projects-7b3f74ab.vercel.app",  # current preview"
-]
-
-# Add frontend URL from config if specified (for production)
-if settings.FRONTEND_URL:
-    if settings.FRONTEND_URL not in allowed_origins:
-        allowed_origins.append(settings.FRONTEND_URL)
-    # Also add without trailing slash
-    frontend_no_slash = settings.FRONTEND_URL.rstrip('/')
-    if frontend_no_slash not in allowed_origins:
-        allowed_origins.append(frontend_no_slash)
-
 # Debug: Print allowed origins
 if settings.DEBUG:
-    print(f"CORS allowed origins: {allowed_origins}")
+    print(f"CORS allowed origins: {sorted(ALLOWED_ORIGINS)}")
 
-# Request logging middleware for debugging
+# Request logging middleware for debugging (only failed or slow requests are logged)
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        if settings.DEBUG:
-            start_time = time.time()
-            print(f"\n{'='*60}")
-            print(f"Request: {request.method} {request.url}")
-            print(f"Origin: {request.headers.get('origin', 'N/A')}")
-            print(f"Content-Type: {request.headers.get('content-type', 'N/A')}")
-        
+        start_time = time.perf_counter()
         try:
             response = await call_next(request)
-            if settings.DEBUG:
-                process_time = time.time() - start_time
-                print(f"Response: {response.status_code} ({process_time:.3f}s)")
-                print(f"{'='*60}\n")
-            return response
         except Exception as e:
-            if settings.DEBUG:
-                print(f"ERROR in middleware: {type(e).__name__}: {e}")
-                print(traceback.format_exc())
-                print(f"{'='*60}\n")
+            logger.exception("Unhandled error for %s %s", request.method, request.url.path)
             # Return error response instead of raising to prevent connection reset
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={"detail": f"Internal server error: {str(e)}"}
             )
+        
+        process_time = time.perf_counter() - start_time
+        if response.status_code >= 400 or process_time > settings.SLOW_REQUEST_THRESHOLD:
+            logger.info(
+                "%s %s -> %s (%.3fs)",
+                request.method,
+                request.url.path,
+                response.status_code,
+                process_time,
+                extra={"origin": request.headers.get("origin")},
+            )
+        return response
 
 # Use specific origins to allow credentials (needed for cookies/auth tokens)
 # CORS middleware must be added BEFORE other middleware to handle preflight requests
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["*"],
+    # Explicit headers keep preflight responses small and cacheable
+    allow_headers=["Authorization", "Content-Type", "Accept", "X-Requested-With"],
+    expose_headers=["X-Next-Cursor"],
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
@@ -95,17 +81,18 @@ if settings.DEBUG:
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors gracefully."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": exc.errors()},
+        content={"detail": jsonable_encoder(exc.errors())},
     )
 
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions gracefully."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
+        headers=exc.headers,
     )
 
 @app.exception_handler(Exception)
@@ -113,7 +100,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions to prevent connection resets."""
     if settings.DEBUG:
         # In debug mode, show full traceback
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "detail": str(exc),
@@ -122,7 +109,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         )
     else:
         # In production, hide internal errors
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": "Internal server error"},
 )
@@ -130,38 +117,13 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on application startup."""
+    """
+    Log startup information.
+    Schema creation and seeding run once per deploy via scripts/bootstrap.py.
+    """
     print("\n" + "=" * 60)
-    print("FastAPI Server Starting...")
-    print("=" * 60)
-
-    try:
-        init_db()
-        print("✓ Database initialized")
-    except Exception as e:
-        print(f"✗ Database initialization failed: {e}")
-        raise
-
-    # Migrate crop_type column if needed
-    try:
-        from scripts.migrate_crop_type import migrate_crop_type
-        migrate_crop_type()
-    except Exception as e:
-        # Log error but don't fail startup
-        print(f"⚠ Warning: Could not migrate crop_type column: {e}")
-    
-    # Seed initial data (crops and markets)
-    try:
-        from scripts.seed_data import seed_all
-        seed_all()
-        print("✓ Initial data seeded")
-    except Exception as e:
-        # Log error but don't fail startup
-        print(f"⚠ Warning: Could not seed initial data: {e}")
-    
-    print("="*60)
     print("Server is ready and listening for requests!")
-    print(f"CORS enabled for origins: {allowed_origins}")
+    print(f"CORS enabled for origins: {sorted(ALLOWED_ORIGINS)}")
     print("="*60 + "\n")
 
 
@@ -192,11 +154,28 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """
+    Liveness check endpoint. Does not touch the database, so a brief
+    database outage does not get the API container restarted.
+    """
     print("[HEALTH] Health check called")
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+def readiness_check():
+    """Readiness check endpoint. Verifies the database answers a trivial query."""
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception:
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable"},
+        )
+    return {"status": "ready"}
+
+
 @app.get("/simple-test")
 async def simple_test():
     """Very simple test endpoint with no dependencies."""
@@ -224,9 +203,6 @@ async def test_post_endpoint(request: Request):
 async def test_db_connection():
     """Test database connection."""
     try:
-        from database import engine
-        from sqlmodel import text
-        
         with engine.connect() as conn:
             result = conn.execute(text("SELECT 1"))
             result.fetchone()
@@ -4,7 +4,7 @@ Alert model for GebeyaAlert.
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship, ForeignKey, Column, Numeric
-from sqlalchemy import Index
+from sqlalchemy import Index, UniqueConstraint, text
 
 from .base import BaseModel, TimestampMixin
 
@@ -41,7 +41,15 @@ class Alert(BaseModel, TimestampMixin, table=True):
         Index("idx_alert_user_id", "user_id"),
         Index("idx_alert_crop_id", "crop_id"),
         Index("idx_alert_market_id", "market_id"),
-        Index("idx_alert_user_crop_market", "user_id", "crop_id", "market_id"),
+        # One alert per user per crop per market; also serves lookups by user
+        UniqueConstraint("user_id", "crop_id", "market_id", name="uq_alert_user_crop_market"),
+        # Alerts that have never been sent, scanned by the alert checker
+        Index(
+            "idx_alert_pending",
+            "crop_id",
+            "market_id",
+            postgresql_where=text("last_sent_at IS NULL"),
+        ),
     )
 
 
@@ -3,12 +3,19 @@ Base model class for all database models.
 """
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import DateTime, func
 from sqlmodel import SQLModel, Field
 
 
 class TimestampMixin(SQLModel):
     """Mixin class for timestamp fields."""
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Filled in by the database on INSERT
+    created_at: datetime = Field(
+        default=None,
+        sa_type=DateTime,
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False
+    )
     updated_at: Optional[datetime] = Field(default=None)
 
 
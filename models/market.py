@@ -3,7 +3,7 @@ Market model for GebeyaAlert.
 """
 from typing import Optional, List, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship, Column, String
-from sqlalchemy import Index
+from sqlalchemy import Index, UniqueConstraint
 
 from .base import BaseModel
 
@@ -34,7 +34,8 @@ class Market(BaseModel, table=True):
     __table_args__ = (
         Index("idx_market_name", "name"),
         Index("idx_market_region", "region"),
-        Index("idx_market_name_region", "name", "region"),
+        # One market per name and region; also serves lookups by both
+        UniqueConstraint("name", "region", name="uq_market_name_region"),
     )
 
 
@@ -4,7 +4,7 @@ Price model for GebeyaAlert.
 from datetime import date
 from typing import Optional, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship, ForeignKey, Column, Date, Numeric
-from sqlalchemy import Index
+from sqlalchemy import Index, desc
 
 from .base import BaseModel
 
@@ -18,14 +18,14 @@ class Price(BaseModel, table=True):
     
     __tablename__ = "prices"
     
-    crop_id: int = Field(foreign_key="crops.id", nullable=False, index=True)
+    crop_id: int = Field(foreign_key="crops.id", nullable=False)
     market_id: int = Field(foreign_key="markets.id", nullable=False, index=True)
     price: float = Field(
         sa_column=Column(Numeric(10, 2), nullable=False),
         description="Price of the crop at the market"
     )
     price_date: date = Field(
-        sa_column=Column(name="date", type_=Date, nullable=False, index=True),
+        sa_column=Column(name="date", type_=Date, nullable=False),
         description="Date of the price record"
     )
     
@@ -34,11 +34,22 @@ class Price(BaseModel, table=True):
     market: "Market" = Relationship(back_populates="prices")
     
     # Indexes
+    # market_id gets a single-column index from index=True; crop_id lookups
+    # use the leading column of the unique index below.
+    # The descending date index serves "latest price" ORDER BY date DESC LIMIT 1.
     __table_args__ = (
-        Index("idx_price_crop_id", "crop_id"),
-        Index("idx_price_market_id", "market_id"),
-        Index("idx_price_date", "date"),
-        Index("idx_price_crop_market_date", "crop_id", "market_id", "date"),
+        Index("idx_price_date_desc", desc("date")),
+        # One price per crop per market per day. It doubles as the index for
+        # crop/market/date filters and, with price included on PostgreSQL,
+        # answers per-pair latest-price lookups index-only.
+        Index(
+            "uq_price_crop_market_date",
+            "crop_id",
+            "market_id",
+            desc("date"),
+            unique=True,
+            postgresql_include=["price"],
+        ),
     )
 
 
@@ -4,7 +4,7 @@ User model for GebeyaAlert.
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship, Column, String
-from sqlalchemy import Boolean, Index
+from sqlalchemy import Boolean, Index, false
 
 from .base import BaseModel, TimestampMixin
 
@@ -23,13 +23,13 @@ class User(BaseModel, TimestampMixin, table=True):
         description="User's phone number (unique identifier)"
     )
     language: str = Field(
-        default="en",
-        sa_column=Column(String(10), nullable=False),
+        default=None,
+        sa_column=Column(String(10), nullable=False, server_default='en'),
         description="User's preferred language (e.g., 'en', 'am', 'om')"
     )
     is_admin: bool = Field(
-        default=False,
-        sa_column=Column(Boolean, nullable=False, server_default='false'),
+        default=None,
+        sa_column=Column(Boolean, nullable=False, server_default=false()),
         description="Whether the user is an administrator"
     )
     
@@ -1,10 +1,15 @@
 """
 Admin router.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, date
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlmodel import Session, select, func
-from typing import List, Dict, Any
+from sqlalchemy import exists
+from sqlalchemy.orm import raiseload
+from typing import List, Dict, Any, Optional
 
+from cache import ADMIN_STATS_CACHE_KEY, cache_get, cache_set
+from config import settings
 from database import get_db
 from models.user import User
 from models.alert import Alert
@@ -14,19 +19,33 @@ from models.price import Price
 from schemas.user import UserResponse, UserCreate, UserUpdate
 from schemas.crop import CropResponse
 from schemas.market import MarketResponse
-from dependencies import require_admin
+from dependencies import require_admin, invalidate_cached_user
+from services.auth_service import AuthService
 
 router = APIRouter()
 
 @router.get("/users", response_model=List[UserResponse])
 def list_users(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    after_id: Optional[int] = Query(None, description="Return users with an ID greater than this cursor"),
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
-    """List all users (admin only)"""
-    users = db.exec(select(User).offset(skip).limit(limit)).all()
+    """
+    List users (admin only).
+    Keyset-paginated by ID; the cursor for the next page is returned in the
+    X-Next-Cursor header.
+    """
+    # UserResponse only exposes scalar columns; refuse relationship lazy loads
+    # so a schema change can't silently turn this into an N+1 query
+    statement = select(User).options(raiseload("*")).order_by(User.id).limit(limit)
+    if after_id is not None:
+        statement = statement.where(User.id > after_id)
+    users = db.exec(statement).all()
+    
+    if len(users) == limit:
+        response.headers["X-Next-Cursor"] = str(users[-1].id)
     return users
 
 @router.post("/users", response_model=UserResponse)
@@ -37,15 +56,15 @@ def create_user(
 ):
     """Create a new user (admin only)"""
     # Check if user already exists
-    existing_user = db.exec(select(User).where(User.phone_number == user_data.phone_number)).first()
-    if existing_user:
+    phone_taken = db.exec(select(exists().where(User.phone_number == user_data.phone_number))).one()
+    if phone_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this phone number already exists"
         )
     
     # Create new user
-    user = User(**user_data.dict())
+    user = User(**user_data.model_dump())
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -66,14 +85,20 @@ def update_user(
             detail="User not found"
         )
     
+    previous_phone = user.phone_number
+    
     # Update fields
-    update_data = user_data.dict(exclude_unset=True)
+    update_data = user_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(user, field, value)
+    user.updated_at = datetime.utcnow()
     
-    db.add(user)
+    # The user is already tracked by the session and sessions don't expire
+    # on commit, so no add()/refresh() round-trip is needed
     db.commit()
-    db.refresh(user)
+    invalidate_cached_user(user_id)
+    if user.phone_number != previous_phone:
+        AuthService.invalidate_cached_phone(previous_phone)
     return user
 
 @router.post("/users/{user_id}/make-admin")
@@ -91,8 +116,9 @@ def make_admin(
         )
     
     user.is_admin = True
-    db.add(user)
+    user.updated_at = datetime.utcnow()
     db.commit()
+    invalidate_cached_user(user_id)
     return {"message": f"User {user.phone_number} is now an admin"}
 
 
@@ -102,18 +128,32 @@ def get_stats(
     current_user: User = Depends(require_admin)
 ):
     """Get statistics for admin dashboard"""
-    total_users = db.exec(select(func.count(User.id))).one()
-    active_alerts = db.exec(select(func.count(Alert.id))).one()
-    total_markets = db.exec(select(func.count(Market.id))).one()
+    cached = cache_get(ADMIN_STATS_CACHE_KEY)
+    if cached is not None:
+        return cached
+    
+    # Fetch all dashboard figures in a single round-trip
+    statement = select(
+        select(func.count(User.id)).scalar_subquery().label("total_users"),
+        select(func.count(Alert.id)).scalar_subquery().label("active_alerts"),
+        select(func.count(Market.id)).scalar_subquery().label("total_markets"),
+        select(Price.price_date)
+        .order_by(Price.price_date.desc())
+        .limit(1)
+        .scalar_subquery()
+        .label("latest_price_date"),
+    )
+    row = db.exec(statement).one()
+    total_users = row.total_users
+    active_alerts = row.active_alerts
+    total_markets = row.total_markets
     
     # Get latest price update time (simplified - just show if prices exist)
-    latest_price = db.exec(select(Price).order_by(Price.price_date.desc()).limit(1)).first()
     recent_updates = "None"
-    if latest_price:
-        from datetime import datetime, date
+    if row.latest_price_date:
         # Calculate days since latest price date
-        if isinstance(latest_price.price_date, date):
-            days_ago = (datetime.utcnow().date() - latest_price.price_date).days
+        if isinstance(row.latest_price_date, date):
+            days_ago = (datetime.utcnow().date() - row.latest_price_date).days
             if days_ago == 0:
                 recent_updates = "Today"
             elif days_ago == 1:
@@ -121,12 +161,14 @@ def get_stats(
             else:
                 recent_updates = f"{days_ago} days"
     
-    return {
+    stats = {
         "total_users": total_users,
         "active_alerts": active_alerts,
         "total_markets": total_markets,
         "recent_updates": recent_updates
     }
+    cache_set(ADMIN_STATS_CACHE_KEY, stats, settings.ADMIN_STATS_CACHE_TTL)
+    return stats
 
 
 @router.get("/markets", response_model=List[MarketResponse])
@@ -1,21 +1,24 @@
 """
 Alerts router.
 """
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
 from database import get_db
-from schemas.alert import AlertCreate, AlertResponse
+from schemas.alert import AlertCreate, AlertResponse, AlertResponseWithDetails
 from services.alert_service import AlertService
 from dependencies import require_user
 from models.user import User
 
 router = APIRouter()
 
+_ALERTS_ADAPTER = TypeAdapter(List[AlertResponseWithDetails])
+
 
 @router.post("", response_model=AlertResponse, status_code=status.HTTP_201_CREATED)
-async def create_alert(
+def create_alert(
     alert_data: AlertCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_user)
@@ -36,24 +39,39 @@ async def create_alert(
     return alert
 
 
-@router.get("", response_model=List[Dict[str, Any]])
-async def get_alerts(
+@router.get("", response_model=List[AlertResponseWithDetails])
+def get_alerts(
+    before_id: Optional[int] = Query(None, description="Return alerts with an ID lower than this cursor"),
+    limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_user)
 ):
     """
-    Get all alerts for the current user with details (crop/market names and current prices).
+    Get alerts for the current user with details (crop/market names and current prices).
     Requires authentication.
+    Keyset-paginated by ID, newest first; the cursor for the next page is
+    returned in the X-Next-Cursor header.
     
     Returns:
         List of user's alerts with crop name, market name, and current price
     """
-    alerts = AlertService.get_user_alerts_with_details(db, current_user.id)
-    return alerts
+    alerts = AlertService.get_user_alerts_with_details(
+        db,
+        current_user.id,
+        limit=limit,
+        before_id=before_id
+    )
+    
+    headers = {}
+    if len(alerts) == limit:
+        headers["X-Next-Cursor"] = str(alerts[-1]["id"])
+    
+    payload = _ALERTS_ADAPTER.dump_json(_ALERTS_ADAPTER.validate_python(alerts))
+    return Response(payload, media_type="application/json", headers=headers)
 
 
 @router.delete("/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_alert(
+def delete_alert(
     alert_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_user)
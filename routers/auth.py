@@ -1,28 +1,50 @@
 """
 Authentication router.
 """
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 from datetime import timedelta
-import traceback
 
 from database import get_db
-from schemas.auth import RegisterRequest, LoginRequest, TokenResponse, UserResponse
+from schemas.auth import RegisterRequest, LoginRequest, OTPRequest, TokenResponse, UserResponse
 from services.auth_service import AuthService
 from utils.jwt import create_access_token
 from config import settings
 from fastapi.security import OAuth2PasswordRequestForm
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+@router.post("/otp", status_code=status.HTTP_202_ACCEPTED)
+def request_login_otp(
+    otp_request: OTPRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Text a one-time login code to a registered phone number.
+    The code is then submitted as the password to /login.
+    Only available when OTP_VERIFICATION_ENABLED is set.
+    """
+    if not settings.OTP_VERIFICATION_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="OTP login is not enabled"
+        )
+
+    logger.debug("OTP requested for phone %s", otp_request.phone_number)
+    AuthService.send_login_otp(db, otp_request.phone_number)
+    return {"detail": "If the number is registered, a login code has been sent"}
+
+
 # Add this endpoint to the auth router
 @router.post("/login", response_model=TokenResponse)
-async def login_for_access_token(
+def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
-    if settings.DEBUG:
-        print(f"[LOGIN] Attempting login for phone: {form_data.username}")
+    logger.debug("Login attempt for phone %s", form_data.username)
 
     try:
         # In our case, the username field will contain the phone number
@@ -32,8 +54,7 @@ async def login_for_access_token(
             password=form_data.password  # This would be the OTP in your case
         )
         if not user:
-            if settings.DEBUG:
-                print("[LOGIN] Authentication failed")
+            logger.debug("Login failed for phone %s", form_data.username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect phone number or OTP",
@@ -46,15 +67,15 @@ async def login_for_access_token(
             expires_delta=access_token_expires
         )
 
-        if settings.DEBUG:
-            print("[LOGIN] Login successful")
+        logger.debug("Login successful for user %s", user.id)
 
         return {"access_token": access_token, "token_type": "bearer"}
 
-    except Exception as e:
-        if settings.DEBUG:
-            print(f"[LOGIN] Error: {e}")
-            print(traceback.format_exc())
+    except HTTPException:
+        raise
+
+    except Exception:
+        logger.exception("Login failed for phone %s", form_data.username)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Login failed"
@@ -62,22 +83,21 @@ async def login_for_access_token(
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def register(
+def register(
     user_data: RegisterRequest,
     db: Session = Depends(get_db)
 ):
-    if settings.DEBUG:
-        print(f"[REGISTER] Received request with phone: {user_data.phone_number}, language: {user_data.language}")
+    logger.debug(
+        "Registration request for phone %s, language %s",
+        user_data.phone_number,
+        user_data.language
+    )
 
     try:
-        if settings.DEBUG:
-            print("[REGISTER] Starting user registration...")
-
         # Register user
         user = AuthService.register_user(db, user_data)
 
-        if settings.DEBUG:
-            print(f"[REGISTER] User created with ID: {user.id}")
+        logger.debug("Registered user %s", user.id)
 
         # Create access token
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -86,20 +106,14 @@ async def register(
             expires_delta=access_token_expires
         )
 
-        if settings.DEBUG:
-            print("[REGISTER] Access token created successfully")
-
         return TokenResponse(access_token=access_token)
 
     except HTTPException as he:
-        if settings.DEBUG:
-            print(f"[REGISTER] HTTPException: {he.status_code} - {he.detail}")
+        logger.debug("Registration rejected: %s - %s", he.status_code, he.detail)
         raise
 
     except Exception as e:
-        if settings.DEBUG:
-            print(f"[REGISTER] Error: {e}")
-            print(traceback.format_exc())
+        logger.exception("Registration failed for phone %s", user_data.phone_number)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Registration failed: {str(e)}"
@@ -3,8 +3,12 @@ Crops router.
 """
 from typing import List
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
+from cache import CROPS_CACHE_KEY, cache_delete, cache_get, cache_set
+from config import settings
 from database import get_db
 from schemas.crop import CropCreate, CropResponse
 from services.crop_service import CropService
@@ -13,21 +17,31 @@ from models.user import User
 
 router = APIRouter()
 
+# Built at import so the list schema is compiled once per process
+_CROPS_ADAPTER = TypeAdapter(List[CropResponse])
+
 
 @router.get("", response_model=List[CropResponse])
-async def get_crops(
+def get_crops(
     db: Session = Depends(get_db)
 ):
     """
     Get all crops.
     Public endpoint - no authentication required.
     """
-    crops = CropService.get_all_crops(db)
-    return crops
+    cached = cache_get(CROPS_CACHE_KEY)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    crops = _CROPS_ADAPTER.validate_python(CropService.get_all_crops(db), from_attributes=True)
+    payload = _CROPS_ADAPTER.dump_python(crops, mode="json")
+    cache_set(CROPS_CACHE_KEY, payload, settings.PUBLIC_CACHE_TTL)
+    # Returning a Response skips FastAPI's response_model validation pass
+    return ORJSONResponse(payload)
 
 
 @router.post("", response_model=CropResponse, status_code=status.HTTP_201_CREATED)
-async def create_crop(
+def create_crop(
     crop_data: CropCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -37,5 +51,6 @@ async def create_crop(
     Admin only endpoint.
     """
     crop = CropService.create_crop(db, crop_data)
+    cache_delete(CROPS_CACHE_KEY)
     return crop
 
@@ -3,8 +3,12 @@ Markets router.
 """
 from typing import List
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
+from cache import MARKETS_CACHE_KEY, cache_delete, cache_get, cache_set
+from config import settings
 from database import get_db
 from schemas.market import MarketCreate, MarketResponse
 from services.market_service import MarketService
@@ -13,21 +17,29 @@ from models.user import User
 
 router = APIRouter()
 
+_MARKETS_ADAPTER = TypeAdapter(List[MarketResponse])
+
 
 @router.get("", response_model=List[MarketResponse])
-async def get_markets(
+def get_markets(
     db: Session = Depends(get_db)
 ):
     """
     Get all markets.
     Public endpoint - no authentication required.
     """
-    markets = MarketService.get_all_markets(db)
-    return markets
+    cached = cache_get(MARKETS_CACHE_KEY)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    markets = _MARKETS_ADAPTER.validate_python(MarketService.get_all_markets(db), from_attributes=True)
+    payload = _MARKETS_ADAPTER.dump_python(markets, mode="json")
+    cache_set(MARKETS_CACHE_KEY, payload, settings.PUBLIC_CACHE_TTL)
+    return ORJSONResponse(payload)
 
 
 @router.post("", response_model=MarketResponse, status_code=status.HTTP_201_CREATED)
-async def create_market(
+def create_market(
     market_data: MarketCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -37,5 +49,6 @@ async def create_market(
     Admin only endpoint.
     """
     market = MarketService.create_market(db, market_data)
+    cache_delete(MARKETS_CACHE_KEY)
     return market
 
@@ -2,21 +2,38 @@
 Prices router.
 """
 from datetime import date as date_type
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
+from cache import PRICES_CACHE_PREFIX, cache_delete_prefix, cache_get, cache_set
+from config import settings
 from database import get_db
-from schemas.price import PriceCreate, PriceResponse
+from schemas.price import PriceCreate, PriceResponse, PriceResponseWithDetails
 from services.price_service import PriceService
 from dependencies import require_admin
+from models.price import Price
 from models.user import User
 
 router = APIRouter()
 
+_LATEST_PRICES_ADAPTER = TypeAdapter(List[PriceResponseWithDetails])
+
+
+def _stream_json_array(prices: Iterator[Price]) -> Iterator[str]:
+    """Serialize prices as a JSON array one row at a time."""
+    yield "["
+    for index, price in enumerate(prices):
+        if index:
+            yield ","
+        yield PriceResponse.model_validate(price).model_dump_json()
+    yield "]"
+
 
 @router.get("", response_model=List[PriceResponse])
-async def get_prices(
+def get_prices(
     crop_id: Optional[int] = Query(None, description="Filter by crop ID"),
     market_id: Optional[int] = Query(None, description="Filter by market ID"),
     date: Optional[date_type] = Query(None, description="Filter by date (YYYY-MM-DD)"),
@@ -26,6 +43,9 @@ async def get_prices(
     Get prices with optional filters.
     Public endpoint - no authentication required.
     
+    The JSON array is streamed as rows are read, so large result sets are
+    never held in memory in full.
+    
     Query parameters:
     - crop_id: Filter by crop ID
     - market_id: Filter by market ID
@@ -38,17 +58,17 @@ async def get_prices(
     - GET /prices?crop_id=1&market_id=2 - Get prices for crop 1 at market 2
     - GET /prices?date=2024-01-15 - Get prices for specific date
     """
-    prices = PriceService.get_prices(
+    prices = PriceService.stream_prices(
         db,
         crop_id=crop_id,
         market_id=market_id,
         price_date=date
     )
-    return prices
+    return StreamingResponse(_stream_json_array(prices), media_type="application/json")
 
 
-@router.get("/latest", response_model=List[Dict[str, Any]])
-async def get_latest_prices(
+@router.get("/latest", response_model=List[PriceResponseWithDetails])
+def get_latest_prices(
     limit: int = Query(10, ge=1, le=100, description="Maximum number of prices to return"),
     db: Session = Depends(get_db)
 ):
@@ -59,12 +79,21 @@ async def get_latest_prices(
     Returns the most recent price for each crop-market combination,
     with trend calculated based on price 7 days ago.
     """
-    prices = PriceService.get_latest_prices_with_details(db, limit=limit)
-    return prices
+    cache_key = f"{PRICES_CACHE_PREFIX}latest:{limit}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    prices = _LATEST_PRICES_ADAPTER.validate_python(
+        PriceService.get_latest_prices_with_details(db, limit=limit)
+    )
+    payload = _LATEST_PRICES_ADAPTER.dump_python(prices, mode="json")
+    cache_set(cache_key, payload, settings.PUBLIC_CACHE_TTL)
+    return ORJSONResponse(payload)
 
 
 @router.post("", response_model=PriceResponse, status_code=status.HTTP_201_CREATED)
-async def create_price(
+def create_price(
     price_data: PriceCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -82,5 +111,26 @@ async def create_price(
         Created price entry
     """
     price = PriceService.create_price(db, price_data)
+    cache_delete_prefix(PRICES_CACHE_PREFIX)
     return price
 
+
+@router.post("/bulk", response_model=List[PriceResponse], status_code=status.HTTP_201_CREATED)
+def bulk_create_prices(
+    prices_data: List[PriceCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """
+    Create many price entries at once, e.g. a day's market report.
+    Admin only endpoint.
+    
+    Prices already recorded for their crop, market and date are skipped.
+    
+    Returns:
+        Created price entries
+    """
+    prices = PriceService.bulk_create_prices(db, prices_data)
+    if prices:
+        cache_delete_prefix(PRICES_CACHE_PREFIX)
+    return prices
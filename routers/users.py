@@ -1,32 +1,34 @@
 """
 Users router.
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlmodel import Session
 
 from database import get_db
 from schemas.user import UserResponse, UserUpdate
 from services.user_service import UserService
-from dependencies import require_user
+from dependencies import require_user, invalidate_cached_user
 from models.user import User
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(
-    current_user: User = Depends(require_user),
-    db: Session = Depends(get_db)
+def get_current_user_info(
+    current_user: User = Depends(require_user)
 ):
     """
     Get current user information.
     Requires authentication.
     """
-    return current_user
+    return Response(
+        content=UserResponse.model_validate(current_user).model_dump_json(),
+        media_type="application/json"
+    )
 
 
 @router.patch("/me", response_model=UserResponse)
-async def update_current_user(
+def update_current_user(
     user_data: UserUpdate,
     current_user: User = Depends(require_user),
     db: Session = Depends(get_db)
@@ -40,6 +42,7 @@ async def update_current_user(
     - Language preference
     """
     updated_user = UserService.update_user(db, current_user.id, user_data)
+    invalidate_cached_user(current_user.id)
     return updated_user
 
 
@@ -11,7 +11,7 @@ class AlertCreate(BaseModel):
     """Schema for creating an alert."""
     crop_id: int = Field(..., description="ID of the crop to monitor")
     market_id: int = Field(..., description="ID of the market to monitor")
-    target_price: Decimal = Field(..., gt=0, description="Target price in ETB (alert triggers when price reaches this)")
+    target_price: Decimal = Field(..., gt=0, max_digits=10, decimal_places=2, description="Target price in ETB (alert triggers when price reaches this)")
 
 
 class AlertResponse(BaseModel):
@@ -30,34 +30,17 @@ class AlertResponse(BaseModel):
 
 
 class AlertResponseWithDetails(BaseModel):
-    """Schema for alert response with crop and market details."""
+    """Schema for alert response with crop/market names and the current price."""
     id: int
     user_id: int
     crop_id: int
     market_id: int
-    target_price: Decimal
+    crop: str
+    market: str
+    market_region: str
+    target_price: float
+    current_price: Optional[float] = None
+    is_met: bool
     last_sent_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
-    crop_name: Optional[str] = None
-    market_name: Optional[str] = None
-    market_region: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
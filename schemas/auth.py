@@ -2,23 +2,20 @@
 Authentication schemas.
 """
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, Field, field_validator
+from typing import Annotated, Optional
 from utils.phone import normalize_phone_number
 
+# Phone number normalized to +251 format during validation
+PhoneNumber = Annotated[str, AfterValidator(normalize_phone_number)]
+
 
 class RegisterRequest(BaseModel):
     """Request schema for user registration."""
-    phone_number: str = Field(..., description="Phone number in any format")
+    phone_number: PhoneNumber = Field(..., description="Phone number in any format")
     password: str = Field(..., min_length=1, description="User password")
     language: str = Field(default="en", description="User's preferred language")
     
-    @field_validator('phone_number')
-    @classmethod
-    def normalize_phone(cls, v: str) -> str:
-        """Normalize phone number to +251 format."""
-        return normalize_phone_number(v)
-    
     @field_validator('language')
     @classmethod
     def validate_language(cls, v: str) -> str:
@@ -30,13 +27,13 @@ class RegisterRequest(BaseModel):
 
 class LoginRequest(BaseModel):
     """Request schema for user login."""
-    phone_number: str = Field(..., description="Phone number in any format")
-    otp: str = Optional
-    @field_validator('phone_number')
-    @classmethod
-    def normalize_phone(cls, v: str) -> str:
-        """Normalize phone number to +251 format."""
-        return normalize_phone_number(v)
+    phone_number: PhoneNumber = Field(..., description="Phone number in any format")
+    otp: Optional[str] = None
+
+
+class OTPRequest(BaseModel):
+    """Request schema for issuing a login OTP."""
+    phone_number: PhoneNumber = Field(..., description="Phone number in any format")
 
 
 class TokenResponse(BaseModel):
@@ -11,7 +11,7 @@ class PriceCreate(BaseModel):
     """Schema for creating a price."""
     crop_id: int = Field(..., description="ID of the crop")
     market_id: int = Field(..., description="ID of the market")
-    price: Decimal = Field(..., gt=0, description="Price in ETB (Ethiopian Birr)")
+    price: Decimal = Field(..., gt=0, max_digits=10, decimal_places=2, description="Price in ETB (Ethiopian Birr)")
     price_date: date = Field(..., description="Date of the price record")
 
 
@@ -28,20 +28,14 @@ class PriceResponse(BaseModel):
 
 
 class PriceResponseWithDetails(BaseModel):
-    """Schema for price response with crop and market details."""
+    """Schema for latest price response with crop/market details and 7-day trend."""
     id: int
     crop_id: int
     market_id: int
-    price: Decimal
+    crop_name: str
+    crop_type: str
+    market_name: str
+    market_region: str
+    price: float
     price_date: date
-    crop_name: Optional[str] = None
-    market_name: Optional[str] = None
-    market_region: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
-
-
-
-
-
+    price_change_7d: float
@@ -0,0 +1,55 @@
+"""
+One-off database bootstrap: apply Alembic migrations and seed data.
+
+Run once per deploy, before starting the API workers:
+    python -m scripts.bootstrap
+"""
+import sys
+import os
+
+# Add parent directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from database import engine
+
+# Revision matching the schema previously created by SQLModel.metadata.create_all
+BASELINE_REVISION = "0001"
+
+
+def migrate_database():
+    """Upgrade the database schema to the latest Alembic revision."""
+    alembic_cfg = Config(os.path.join(ROOT_DIR, "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", os.path.join(ROOT_DIR, "alembic"))
+
+    # Databases created before Alembic was introduced already have the
+    # baseline tables; mark them as such instead of re-creating them
+    inspector = inspect(engine)
+    if inspector.has_table("users") and not inspector.has_table("alembic_version"):
+        command.stamp(alembic_cfg, BASELINE_REVISION)
+        print(f"✓ Existing database stamped at revision {BASELINE_REVISION}")
+
+    command.upgrade(alembic_cfg, "head")
+    print("✓ Database migrated")
+
+
+def bootstrap_database():
+    """Prepare the database schema and initial data."""
+    migrate_database()
+
+    # Seed initial data (crops and markets)
+    try:
+        from scripts.seed_data import seed_all
+        seed_all()
+        print("✓ Initial data seeded")
+    except Exception as e:
+        # Log error but don't fail the bootstrap
+        print(f"⚠ Warning: Could not seed initial data: {e}")
+
+
+if __name__ == "__main__":
+    bootstrap_database()
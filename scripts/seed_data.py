@@ -1,9 +1,9 @@
 """
 Seed script for initial data (crops and markets).
 """
-from sqlmodel import Session, select
+from sqlmodel import Session
 
-from database import engine
+from database import engine, insert_ignoring_conflicts
 from models.crop import Crop
 from models.market import Market
 
@@ -11,24 +11,17 @@ from models.market import Market
 def seed_crops(db: Session):
     """Seed example crops."""
     crops_data = [
-        {"name": "Maize"},
-        {"name": "Wheat"},
-        {"name": "Tomato"},
+        {"name": "Maize", "crop_type": "Grain"},
+        {"name": "Wheat", "crop_type": "Grain"},
+        {"name": "Tomato", "crop_type": "Grain"},
     ]
     
-    for crop_data in crops_data:
-        # Check if crop already exists
-        statement = select(Crop).where(Crop.name == crop_data["name"])
-        existing_crop = db.exec(statement).first()
-        
-        if not existing_crop:
-            crop = Crop(**crop_data)
-            db.add(crop)
-            print(f"Seeded crop: {crop_data['name']}")
-        else:
-            print(f"Crop already exists: {crop_data['name']}")
-    
+    # One statement for the whole set; crop names are unique, so existing
+    # crops are skipped by the database instead of checked one by one
+    created = insert_ignoring_conflicts(db, Crop, ["name"], crops_data)
     db.commit()
+    
+    print(f"Seeded {len(created)} crop(s), {len(crops_data) - len(created)} already existed")
 
 
 def seed_markets(db: Session):
@@ -39,22 +32,11 @@ def seed_markets(db: Session):
         {"name": "Bahir Dar", "region": "Amhara"},
     ]
     
-    for market_data in markets_data:
-        # Check if market already exists
-        statement = select(Market).where(
-            Market.name == market_data["name"],
-            Market.region == market_data["region"]
-        )
-        existing_market = db.exec(statement).first()
-        
-        if not existing_market:
-            market = Market(**market_data)
-            db.add(market)
-            print(f"Seeded market: {market_data['name']}, {market_data['region']}")
-        else:
-            print(f"Market already exists: {market_data['name']}, {market_data['region']}")
-    
+    # Existing (name, region) pairs are skipped by the unique constraint
+    created = insert_ignoring_conflicts(db, Market, ["name", "region"], markets_data)
     db.commit()
+    
+    print(f"Seeded {len(created)} market(s), {len(markets_data) - len(created)} already existed")
 
 
 def seed_all():
@@ -69,19 +51,3 @@ def seed_all():
 
 if __name__ == "__main__":
     seed_all()
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
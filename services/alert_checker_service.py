@@ -2,62 +2,40 @@
 Service for checking price alerts and sending notifications.
 """
 import logging
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, date, time, timedelta
 from sqlmodel import Session, select
-from typing import List, Optional
-from decimal import Decimal
+from sqlalchemy import and_, func, insert, or_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
+from typing import Iterator, List, Optional, Tuple
 
+from config import settings
+from database import lazy_load_guard
 from models.alert import Alert
 from models.price import Price
 from models.notification_log import NotificationLog
-from models.crop import Crop
-from models.market import Market
-from models.user import User
+from services.price_service import PriceService, has_latest_prices_view, latest_prices_view
 from services.sms_service import sms_service
 
 logger = logging.getLogger(__name__)
 
+# Candidate alerts claimed, processed and committed per transaction
+ALERT_CHUNK_SIZE = 500
+
 
 class AlertCheckerService:
     """Service for checking and processing price alerts."""
     
     @staticmethod
-    def get_latest_price(
-        db: Session,
-        crop_id: int,
-        market_id: int
-    ) -> Optional[Price]:
-        """
-        Get the latest price for a crop at a market.
-        
-        Args:
-            db: Database session
-            crop_id: Crop ID
-            market_id: Market ID
-            
-        Returns:
-            Latest Price object or None if no price found
-        """
-        statement = (
-            select(Price)
-            .where(
-                Price.crop_id == crop_id,
-                Price.market_id == market_id
-            )
-            .order_by(Price.price_date.desc())
-            .limit(1)
-        )
-        
-        return db.exec(statement).first()
-    
-    @staticmethod
-    def should_send_alert(alert: Alert, latest_price: Price) -> bool:
+    def should_send_alert(alert: Alert, latest_price: Price, today: date) -> bool:
         """
         Check if alert should be sent based on price and last_sent_at.
         
         Args:
             alert: Alert object
             latest_price: Latest price for the alert's crop/market
+            today: Current date, computed once per check run
             
         Returns:
             True if alert should be sent, False otherwise
@@ -68,89 +46,216 @@ class AlertCheckerService:
         
         # Check if alert was already sent today
         if alert.last_sent_at:
-            last_sent_date = alert.last_sent_at.date()
-            today = date.today()
-            if last_sent_date == today:
+            if alert.last_sent_at.date() == today:
                 return False
         
         return True
     
     @staticmethod
-    def send_alert_notification(
-        db: Session,
+    def prepare_notification(
         alert: Alert,
         latest_price: Price
-    ) -> bool:
+    ) -> Optional[Tuple[dict, dict]]:
         """
-        Send SMS notification for an alert and update records.
+        Build the SMS arguments and notification log row for an alert.
+        Both are plain values, so the SMS can be sent from a worker thread
+        and the log written later without touching the loaded objects.
         
         Args:
-            db: Database session
             alert: Alert object
             latest_price: Latest price that triggered the alert
             
         Returns:
-            True if notification sent successfully, False otherwise
+            Tuple of (send_price_alert keyword arguments, notification log
+            column values), or None if the alert's related objects are missing
         """
-        try:
-            # Get related objects for message
-            crop = db.get(Crop, alert.crop_id)
-            market = db.get(Market, alert.market_id)
-            user = db.get(User, alert.user_id)
-            
-            if not crop or not market or not user:
-                logger.error(
-                    f"Missing related objects for alert {alert.id}: "
-                    f"crop={crop is not None}, market={market is not None}, user={user is not None}"
-                )
-                return False
-            
-            # Send SMS
-            success, error = sms_service.send_price_alert(
-                to_phone=user.phone_number,
-                crop_name=crop.name,
-                market_name=market.name,
-                current_price=float(latest_price.price),
-                target_price=float(alert.target_price)
+        # Related objects are eager-loaded by check_all_alerts
+        crop = alert.crop
+        market = alert.market
+        user = alert.user
+        
+        if not crop or not market or not user:
+            logger.error(
+                "Missing related objects for alert %s: crop=%s, market=%s, user=%s",
+                alert.id, crop is not None, market is not None, user is not None
             )
+            return None
+        
+        sms_kwargs = {
+            "to_phone": user.phone_number,
+            "crop_name": crop.name,
+            "market_name": market.name,
+            "current_price": float(latest_price.price),
+            "target_price": float(alert.target_price),
+        }
+        log_row = {
+            "user_id": user.id,
+            "message": (
+                f"Price Alert: {crop.name} at {market.name} "
+                f"is now {latest_price.price:.2f} ETB. "
+                f"Your target: {alert.target_price:.2f} ETB"
+            ),
+        }
+        return sms_kwargs, log_row
+    
+    @staticmethod
+    def send_notifications(
+        notifications: List[Tuple[int, dict, dict]]
+    ) -> Iterator[Tuple[int, dict, bool, Optional[str]]]:
+        """
+        Send alert SMS concurrently on a bounded thread pool.
+        Results are yielded on the calling thread as they complete, so
+        database writes stay on the caller's session.
+        
+        Args:
+            notifications: (alert_id, sms_kwargs, log_row) tuples built
+                from prepare_notification
             
-            if not success:
+        Yields:
+            Tuple of (alert_id, log_row, success, error_message)
+        """
+        if not notifications:
+            return
+        
+        max_workers = min(settings.SMS_MAX_WORKERS, len(notifications))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(sms_service.send_price_alert, **sms_kwargs): (alert_id, log_row)
+                for alert_id, sms_kwargs, log_row in notifications
+            }
+            for future in as_completed(futures):
+                alert_id, log_row = futures[future]
+                try:
+                    success, error = future.result()
+                except Exception as e:
+                    success, error = False, str(e)
+                yield alert_id, log_row, success, error
+    
+    @staticmethod
+    def _save_notifications(
+        db: Session,
+        sent: List[Tuple[int, dict]],
+        sent_at: datetime
+    ) -> None:
+        """Mark alerts as sent and insert their logs with one statement each."""
+        db.execute(
+            update(Alert)
+            .where(Alert.id.in_([alert_id for alert_id, _ in sent]))
+            .values(last_sent_at=sent_at)
+            .execution_options(synchronize_session=False)
+        )
+        # A list of parameter sets runs as a single executemany
+        db.execute(
+            insert(NotificationLog),
+            [{**log_row, "sent_at": sent_at} for _, log_row in sent]
+        )
+        db.commit()
+    
+    @staticmethod
+    def commit_notifications(
+        db: Session,
+        sent: List[Tuple[int, dict]],
+        sent_at: datetime
+    ) -> int:
+        """
+        Persist a batch of sent alerts and their notification logs in one
+        transaction. If the batch fails, each pair is retried on its own
+        so one bad row doesn't lose the rest.
+        
+        Args:
+            db: Database session
+            sent: (alert_id, log_row) pairs whose SMS went out
+            sent_at: Timestamp recorded as last_sent_at and in the logs
+            
+        Returns:
+            Number of pairs persisted
+        """
+        if not sent:
+            return 0
+        
+        try:
+            AlertCheckerService._save_notifications(db, sent, sent_at)
+            return len(sent)
+        except SQLAlchemyError as e:
+            logger.error("Error saving %d alert notifications, retrying one by one: %s", len(sent), e)
+            db.rollback()
+        
+        saved = 0
+        for alert_id, log_row in sent:
+            try:
+                AlertCheckerService._save_notifications(db, [(alert_id, log_row)], sent_at)
+                saved += 1
+            except SQLAlchemyError as e:
                 logger.error(
-                    f"Failed to send SMS for alert {alert.id}: {error}"
+                    "Error saving notification for alert %s: %s", alert_id, e,
+                    exc_info=True
                 )
-                return False
-            
-            # Update alert's last_sent_at
-            alert.last_sent_at = datetime.utcnow()
-            db.add(alert)
-            
-            # Log notification
-            notification_log = NotificationLog(
-                user_id=user.id,
-                message=(
-                    f"Price Alert: {crop.name} at {market.name} "
-                    f"is now {latest_price.price:.2f} ETB. "
-                    f"Your target: {alert.target_price:.2f} ETB"
+                db.rollback()
+        return saved
+    
+    @staticmethod
+    def process_alerts(
+        db: Session,
+        candidates: List[Tuple[Alert, Price]],
+        stats: dict,
+        today: date
+    ) -> None:
+        """
+        Notify a chunk of candidate alerts and persist the results.
+        
+        Args:
+            db: Database session
+            candidates: (alert, latest_price) pairs selected by check_all_alerts
+            stats: Processing statistics to update in place
+            today: Current date, computed once per check run
+        """
+        # Alerts to notify, prepared on this thread before sending
+        notifications: List[Tuple[int, dict, dict]] = []
+        
+        for alert, latest_price in candidates:
+            try:
+                # Safety check; the query already applied these conditions
+                if not AlertCheckerService.should_send_alert(alert, latest_price, today):
+                    logger.debug(
+                        "Alert %s: Conditions not met (price: %s, target: %s, last_sent: %s)",
+                        alert.id, latest_price.price, alert.target_price, alert.last_sent_at
+                    )
+                    stats["skipped"] += 1
+                    continue
+                
+                prepared = AlertCheckerService.prepare_notification(alert, latest_price)
+                if prepared is None:
+                    stats["errors"] += 1
+                    continue
+                
+                sms_kwargs, log_row = prepared
+                notifications.append((alert.id, sms_kwargs, log_row))
+                    
+            except Exception as e:
+                logger.error(
+                    "Error processing alert %s: %s", alert.id, e,
+                    exc_info=True
                 )
-            )
-            db.add(notification_log)
-            
-            db.commit()
-            
-            logger.info(
-                f"Alert {alert.id} processed successfully. "
-                f"SMS sent to {user.phone_number}"
-            )
-            
-            return True
+                stats["errors"] += 1
+        
+        # Send SMS concurrently and write the results in one transaction at
+        # the end, so the chunk's row locks are held until it is recorded.
+        # One timestamp is shared by the chunk's sends.
+        pending: List[Tuple[int, dict]] = []
+        sent_at = datetime.utcnow()
+        
+        for alert_id, log_row, success, error in AlertCheckerService.send_notifications(notifications):
+            if not success:
+                logger.error("Failed to send SMS for alert %s: %s", alert_id, error)
+                stats["errors"] += 1
+                continue
             
-        except Exception as e:
-            logger.error(
-                f"Error processing alert {alert.id}: {str(e)}",
-                exc_info=True
-            )
-            db.rollback()
-            return False
+            logger.info("Alert %s processed successfully. SMS sent", alert_id)
+            pending.append((alert_id, log_row))
+        
+        saved = AlertCheckerService.commit_notifications(db, pending, sent_at)
+        stats["sent"] += saved
+        stats["errors"] += len(pending) - saved
     
     @staticmethod
     def check_all_alerts(db: Session) -> dict:
@@ -172,66 +277,104 @@ class AlertCheckerService:
         }
         
         try:
-            # Get all active alerts
-            statement = select(Alert)
-            alerts = list(db.exec(statement).all())
-            stats["total_alerts"] = len(alerts)
+            stats["total_alerts"] = db.exec(
+                select(func.count()).select_from(Alert)
+            ).one()
             
-            logger.info(f"Checking {len(alerts)} alerts...")
+            logger.info("Checking %d alerts...", stats["total_alerts"])
             
-            for alert in alerts:
-                try:
-                    stats["checked"] += 1
-                    
-                    # Get latest price
-                    latest_price = AlertCheckerService.get_latest_price(
-                        db,
-                        alert.crop_id,
-                        alert.market_id
-                    )
-                    
-                    if not latest_price:
-                        logger.debug(
-                            f"Alert {alert.id}: No price data found for "
-                            f"crop {alert.crop_id} at market {alert.market_id}"
-                        )
-                        stats["skipped"] += 1
-                        continue
-                    
-                    # Check if alert should be sent
-                    if not AlertCheckerService.should_send_alert(alert, latest_price):
-                        logger.debug(
-                            f"Alert {alert.id}: Conditions not met "
-                            f"(price: {latest_price.price}, target: {alert.target_price}, "
-                            f"last_sent: {alert.last_sent_at})"
+            # Load only alerts whose latest price meets the target and that
+            # haven't been sent today, with their latest price and their
+            # crop, market and user, in one query
+            today = date.today()
+            today_start = datetime.combine(today, time.min)
+            tomorrow_start = today_start + timedelta(days=1)
+            if has_latest_prices_view(db):
+                # Price writes refresh the view after a debounce delay (or
+                # not at all if that task is lost), so bring it up to date
+                # before alerts are judged against it
+                PriceService.refresh_latest_prices(db)
+                
+                # One row per crop-market pair, so this is an indexed join
+                # instead of a latest-price subquery per alert
+                statement = (
+                    select(Alert, Price)
+                    .join(
+                        latest_prices_view,
+                        and_(
+                            latest_prices_view.c.crop_id == Alert.crop_id,
+                            latest_prices_view.c.market_id == Alert.market_id
                         )
-                        stats["skipped"] += 1
-                        continue
-                    
-                    # Send notification
-                    if AlertCheckerService.send_alert_notification(
-                        db,
-                        alert,
-                        latest_price
-                    ):
-                        stats["sent"] += 1
-                    else:
-                        stats["errors"] += 1
-                        
-                except Exception as e:
-                    logger.error(
-                        f"Error processing alert {alert.id}: {str(e)}",
-                        exc_info=True
                     )
-                    stats["errors"] += 1
+                    .join(Price, Price.id == latest_prices_view.c.id)
+                )
+            else:
+                latest_price_id = (
+                    select(Price.id)
+                    .where(
+                        Price.crop_id == Alert.crop_id,
+                        Price.market_id == Alert.market_id
+                    )
+                    .order_by(Price.price_date.desc())
+                    .limit(1)
+                    .correlate(Alert)
+                    .scalar_subquery()
+                )
+                statement = select(Alert, Price).join(Price, Price.id == latest_price_id)
+            statement = (
+                statement
+                .where(
+                    Price.price >= Alert.target_price,
+                    or_(
+                        Alert.last_sent_at.is_(None),
+                        Alert.last_sent_at < today_start,
+                        Alert.last_sent_at >= tomorrow_start
+                    )
+                )
+                .options(
+                    joinedload(Alert.crop, innerjoin=True),
+                    joinedload(Alert.market, innerjoin=True),
+                    joinedload(Alert.user, innerjoin=True),
+                    *lazy_load_guard()
+                )
+            )
+            
+            # Page through the candidates by ID so only one chunk is in memory
+            # and each chunk's writes commit before the next is read. A
+            # server-side cursor would be closed by those commits.
+            # Each chunk's alerts are locked until its commit; SKIP LOCKED
+            # lets concurrent checkers claim disjoint chunks instead of
+            # notifying the same alerts twice (ignored on SQLite).
+            candidate_count = 0
+            last_id = 0
+            while True:
+                candidates = db.exec(
+                    statement
+                    .where(Alert.id > last_id)
+                    .order_by(Alert.id)
+                    .limit(ALERT_CHUNK_SIZE)
+                    .with_for_update(skip_locked=True, of=Alert)
+                ).all()
+                if not candidates:
+                    break
+                
+                candidate_count += len(candidates)
+                last_id = candidates[-1][0].id
+                AlertCheckerService.process_alerts(db, candidates, stats, today)
+                # Release the locks even if nothing in the chunk was sent
+                db.commit()
+            
+            # Alerts filtered out by the query were checked and skipped
+            stats["checked"] = stats["total_alerts"]
+            stats["skipped"] += stats["total_alerts"] - candidate_count
             
             logger.info(
-                f"Alert check completed: {stats['sent']} sent, "
-                f"{stats['skipped']} skipped, {stats['errors']} errors"
+                "Alert check completed: %d sent, %d skipped, %d errors",
+                stats["sent"], stats["skipped"], stats["errors"]
             )
             
         except Exception as e:
-            logger.error(f"Error in check_all_alerts: {str(e)}", exc_info=True)
+            logger.error("Error in check_all_alerts: %s", e, exc_info=True)
             stats["errors"] += 1
         
         return stats
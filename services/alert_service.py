@@ -6,31 +6,43 @@ from typing import List, Optional
 from fastapi import HTTPException, status
 from decimal import Decimal
 
+from database import insert_ignoring_conflicts
 from models.alert import Alert
 from models.user import User
 from models.crop import Crop
 from models.market import Market
 from schemas.alert import AlertCreate
+from services.validation import validate_crop_and_market_exist
 
 
 class AlertService:
     """Service for alert operations."""
     
     @staticmethod
-    def get_user_alerts(db: Session, user_id: int) -> List[Alert]:
+    def get_user_alerts(
+        db: Session,
+        user_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> List[Alert]:
         """
-        Get all alerts for a specific user.
+        Get a page of alerts for a specific user, newest first.
         
         Args:
             db: Database session
             user_id: User ID
+            limit: Maximum number of alerts to return
+            before_id: Only return alerts with an ID lower than this cursor
             
         Returns:
             List of user's alerts
         """
+        # IDs follow creation order, so they give a tie-free keyset cursor
         statement = select(Alert).where(
             Alert.user_id == user_id
-        ).order_by(Alert.created_at.desc())
+        ).order_by(Alert.id.desc()).limit(limit)
+        if before_id is not None:
+            statement = statement.where(Alert.id < before_id)
         
         return list(db.exec(statement).all())
     
@@ -63,7 +75,7 @@ class AlertService:
         user_id: int,
         crop_id: int,
         market_id: int
-    ) -> Optional[Alert]:
+    ) -> Optional[int]:
         """
         Check if an alert already exists for the given user, crop, and market.
         Prevents duplicate alerts.
@@ -75,61 +87,15 @@ class AlertService:
             market_id: Market ID
             
         Returns:
-            Existing alert if found, None otherwise
+            ID of the existing alert if found, None otherwise
         """
-        statement = select(Alert).where(
+        statement = select(Alert.id).where(
             Alert.user_id == user_id,
             Alert.crop_id == crop_id,
             Alert.market_id == market_id
         )
         return db.exec(statement).first()
     
-    @staticmethod
-    def validate_crop_exists(db: Session, crop_id: int) -> Crop:
-        """
-        Validate that crop exists.
-        
-        Args:
-            db: Database session
-            crop_id: Crop ID
-            
-        Returns:
-            Crop object
-            
-        Raises:
-            HTTPException: If crop not found
-        """
-        crop = db.get(Crop, crop_id)
-        if not crop:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Crop with ID {crop_id} not found"
-            )
-        return crop
-    
-    @staticmethod
-    def validate_market_exists(db: Session, market_id: int) -> Market:
-        """
-        Validate that market exists.
-        
-        Args:
-            db: Database session
-            market_id: Market ID
-            
-        Returns:
-            Market object
-            
-        Raises:
-            HTTPException: If market not found
-        """
-        market = db.get(Market, market_id)
-        if not market:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Market with ID {market_id} not found"
-            )
-        return market
-    
     @staticmethod
     def verify_alert_ownership(db: Session, alert_id: int, user_id: int) -> Alert:
         """
@@ -173,39 +139,42 @@ class AlertService:
         Raises:
             HTTPException: If duplicate alert exists or related entities not found
         """
-        # Validate crop exists
-        AlertService.validate_crop_exists(db, alert_data.crop_id)
-        
-        # Validate market exists
-        AlertService.validate_market_exists(db, alert_data.market_id)
-        
-        # Check for duplicate alert (prevent same user, crop, market combination)
-        existing_alert = AlertService.check_duplicate_alert(
+        validate_crop_and_market_exist(
             db,
-            user_id,
             alert_data.crop_id,
             alert_data.market_id
         )
         
-        if existing_alert:
+        # Insert unless the user already has an alert on this crop and market
+        created = insert_ignoring_conflicts(
+            db,
+            Alert,
+            ["user_id", "crop_id", "market_id"],
+            [{
+                "user_id": user_id,
+                "crop_id": alert_data.crop_id,
+                "market_id": alert_data.market_id,
+                "target_price": alert_data.target_price
+            }]
+        )
+        
+        if not created:
+            db.rollback()
+            existing_id = AlertService.check_duplicate_alert(
+                db,
+                user_id,
+                alert_data.crop_id,
+                alert_data.market_id
+            )
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=status.HTTP_409_CONFLICT,
                 detail=f"Alert already exists for this crop and market. "
-                       f"Use DELETE to remove existing alert (ID: {existing_alert.id}) or update target price"
+                       f"Use DELETE to remove existing alert (ID: {existing_id}) or update target price"
             )
         
-        # Create new alert
-        new_alert = Alert(
-            user_id=user_id,
-            crop_id=alert_data.crop_id,
-            market_id=alert_data.market_id,
-            target_price=alert_data.target_price
-        )
-        db.add(new_alert)
         db.commit()
-        db.refresh(new_alert)
         
-        return new_alert
+        return created[0]
     
     @staticmethod
     def delete_alert(db: Session, alert_id: int, user_id: int) -> None:
@@ -229,64 +198,73 @@ class AlertService:
         db.commit()
     
     @staticmethod
-    def get_user_alerts_with_details(db: Session, user_id: int) -> List[dict]:
+    def get_user_alerts_with_details(
+        db: Session,
+        user_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> List[dict]:
         """
-        Get all alerts for a user with crop/market details and current prices.
+        Get a page of alerts for a user with crop/market details and current
+        prices, newest first.
         
         Args:
             db: Database session
             user_id: User ID
+            limit: Maximum number of alerts to return
+            before_id: Only return alerts with an ID lower than this cursor
             
         Returns:
             List of dictionaries with alert details including crop name, market name, and current price
         """
         from models.price import Price
-        from datetime import date
         
-        alerts = AlertService.get_user_alerts(db, user_id)
+        # Latest price per alert via a correlated subquery, served by the
+        # (crop_id, market_id, date) index, so the whole list is one query
+        latest_price = (
+            select(Price.price)
+            .where(
+                Price.crop_id == Alert.crop_id,
+                Price.market_id == Alert.market_id
+            )
+            .order_by(Price.price_date.desc())
+            .limit(1)
+            .correlate(Alert)
+            .scalar_subquery()
+        )
+        statement = (
+            select(Alert, Crop.name, Market.name, Market.region, latest_price)
+            .join(Crop, Crop.id == Alert.crop_id)
+            .join(Market, Market.id == Alert.market_id)
+            .where(Alert.user_id == user_id)
+            .order_by(Alert.id.desc())
+            .limit(limit)
+        )
+        if before_id is not None:
+            statement = statement.where(Alert.id < before_id)
+        rows = db.exec(statement).all()
         alerts_with_details = []
         
-        for alert in alerts:
-            # Get crop and market details
-            crop = db.get(Crop, alert.crop_id)
-            market = db.get(Market, alert.market_id)
-            
-            if not crop or not market:
-                continue
-            
-            # Get latest price for this crop-market combination
-            price_statement = (
-                select(Price)
-                .where(
-                    Price.crop_id == alert.crop_id,
-                    Price.market_id == alert.market_id
-                )
-                .order_by(Price.price_date.desc())
-                .limit(1)
-            )
-            latest_price_obj = db.exec(price_statement).first()
-            
-            current_price = None
-            if latest_price_obj:
-                current_price = float(latest_price_obj.price)
-            
+        # Prices stay Decimal here; the response schema converts them to
+        # float during validation
+        for alert, crop_name, market_name, market_region, current_price in rows:
             # Determine if alert is met (current price >= target price)
-            is_met = current_price is not None and current_price >= float(alert.target_price)
+            is_met = current_price is not None and current_price >= alert.target_price
             
             alerts_with_details.append({
                 "id": alert.id,
                 "user_id": alert.user_id,
                 "crop_id": alert.crop_id,
                 "market_id": alert.market_id,
-                "crop": crop.name,
-                "market": market.name,
-                "market_region": market.region,
-                "target_price": float(alert.target_price),
+                "crop": crop_name,
+                "market": market_name,
+                "market_region": market_region,
+                "target_price": alert.target_price,
                 "current_price": current_price,
                 "is_met": is_met,
-                "last_sent_at": alert.last_sent_at.isoformat() if alert.last_sent_at else None,
-                "created_at": alert.created_at.isoformat(),
-                "updated_at": alert.updated_at.isoformat() if alert.updated_at else None,
+                "last_sent_at": alert.last_sent_at,
+                "created_at": alert.created_at,
+                "updated_at": alert.updated_at,
             })
         
         return alerts_with_details
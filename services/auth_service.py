@@ -1,15 +1,31 @@
 """
 Authentication service for business logic.
 """
+import logging
+from threading import Lock
 from sqlmodel import Session, select
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 from sqlalchemy.exc import SQLAlchemyError
 import traceback
+import redis
 
 from models.user import User
 from schemas.auth import RegisterRequest
 from config import settings
+from services.sms_service import sms_service
+from utils.otp import claim_otp_cooldown, generate_otp, store_otp, verify_otp
+
+logger = logging.getLogger(__name__)
+
+# Seconds a user looked up by phone number is reused before it is read again
+PHONE_CACHE_TTL = 60
+
+# Detached copies of users keyed by phone number. Only found users are
+# cached, so a new registration is never hidden by a cached miss.
+_user_by_phone_cache: TTLCache = TTLCache(maxsize=10_000, ttl=PHONE_CACHE_TTL)
+_user_by_phone_cache_lock = Lock()
 
 
 class AuthService:
@@ -19,9 +35,36 @@ class AuthService:
     def get_user_by_phone(db: Session, phone_number: str) -> Optional[User]:
         """
         Get user by phone number.
+        Returns a cached copy detached from the session when available;
+        load the user by ID before modifying it.
         """
+        with _user_by_phone_cache_lock:
+            user = _user_by_phone_cache.get(phone_number)
+        if user is not None:
+            return user
+
         statement = select(User).where(User.phone_number == phone_number)
-        return db.exec(statement).first()
+        user = db.exec(statement).first()
+        if user is not None:
+            AuthService.cache_user(user)
+        return user
+
+    @staticmethod
+    def cache_user(user: User) -> None:
+        """
+        Store a detached copy of a user for lookups by phone number.
+        """
+        with _user_by_phone_cache_lock:
+            _user_by_phone_cache[user.phone_number] = User(**user.model_dump())
+
+    @staticmethod
+    def invalidate_cached_phone(phone_number: str) -> None:
+        """
+        Drop a phone number from the lookup cache.
+        Call after a user's phone number changes.
+        """
+        with _user_by_phone_cache_lock:
+            _user_by_phone_cache.pop(phone_number, None)
 
     @staticmethod
     def register_user(db: Session, user_data: RegisterRequest) -> User:
@@ -45,6 +88,7 @@ class AuthService:
             db.add(new_user)
             db.commit()
             db.refresh(new_user)
+            AuthService.cache_user(new_user)
 
             return new_user
 
@@ -88,6 +132,7 @@ class AuthService:
                 db.add(user)
                 db.commit()
                 db.refresh(user)
+                AuthService.cache_user(user)
 
             return user
 
@@ -125,8 +170,66 @@ class AuthService:
                 print(f"[AUTH] User not found: {phone_number}")
             return None
 
-        # TODO: Add OTP verification logic here
+        # OTPs are checked against a SHA-256 digest in Redis, not bcrypt;
+        # they are stored under the normalized number send_login_otp used
+        if settings.OTP_VERIFICATION_ENABLED and not verify_otp(user.phone_number, password):
+            if settings.DEBUG:
+                print(f"[AUTH] Invalid OTP for: {phone_number}")
+            return None
+
         if settings.DEBUG:
             print(f"[AUTH] User authenticated: {user.id}")
 
         return user
+
+    @staticmethod
+    def send_login_otp(db: Session, phone_number: str) -> None:
+        """
+        Issue a login OTP and text it to the user.
+        Unknown numbers get no SMS but no error either, and share the resend
+        cooldown, so the endpoint does not reveal which numbers are registered.
+
+        Raises:
+            HTTPException: If the number is cooling down (429), or the OTP
+                cannot be stored or sent (503)
+        """
+        try:
+            if not claim_otp_cooldown(phone_number):
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="A login code was sent recently, please wait before requesting another",
+                    headers={"Retry-After": str(settings.OTP_RESEND_COOLDOWN_SECONDS)}
+                )
+        except redis.RedisError as e:
+            logger.warning("Could not check OTP cooldown for %s: %s", phone_number, e)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Could not issue a login code, please try again later"
+            )
+
+        user = AuthService.get_user_by_phone(db, phone_number)
+        if not user:
+            logger.debug("OTP requested for unknown phone %s", phone_number)
+            return
+
+        otp = generate_otp()
+        try:
+            store_otp(user.phone_number, otp)
+        except redis.RedisError as e:
+            logger.warning("Could not store OTP for %s: %s", user.phone_number, e)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Could not issue a login code, please try again later"
+            )
+
+        minutes = settings.OTP_TTL_SECONDS // 60
+        success, error = sms_service.send_sms(
+            user.phone_number,
+            f"Your GebeyaAlert login code is {otp}. It expires in {minutes} minutes."
+        )
+        if not success:
+            logger.warning("Could not send OTP to %s: %s", user.phone_number, error)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Could not issue a login code, please try again later"
+            )
@@ -5,6 +5,7 @@ from sqlmodel import Session, select
 from typing import List
 from fastapi import HTTPException, status
 
+from database import insert_ignoring_conflicts
 from models.crop import Crop
 from schemas.crop import CropCreate
 
@@ -64,25 +65,24 @@ class CropService:
         Raises:
             HTTPException: If crop name already exists
         """
-        # Check if crop with same name already exists
-        statement = select(Crop).where(Crop.name == crop_data.name)
-        existing_crop = db.exec(statement).first()
-        if existing_crop:
+        # Insert unless the name is taken
+        created = insert_ignoring_conflicts(
+            db,
+            Crop,
+            ["name"],
+            [{"name": crop_data.name, "crop_type": crop_data.crop_type}]
+        )
+        
+        if not created:
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Crop with this name already exists"
             )
         
-        # Create new crop
-        new_crop = Crop(
-            name=crop_data.name,
-            crop_type=crop_data.crop_type
-        )
-        db.add(new_crop)
         db.commit()
-        db.refresh(new_crop)
         
-        return new_crop
+        return created[0]
 
 
 
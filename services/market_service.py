@@ -5,6 +5,7 @@ from sqlmodel import Session, select
 from typing import List
 from fastapi import HTTPException, status
 
+from database import insert_ignoring_conflicts
 from models.market import Market
 from schemas.market import MarketCreate
 
@@ -64,28 +65,24 @@ class MarketService:
         Raises:
             HTTPException: If market with same name and region already exists
         """
-        # Check if market with same name and region already exists
-        statement = select(Market).where(
-            Market.name == market_data.name,
-            Market.region == market_data.region
+        # Insert unless the name and region are taken
+        created = insert_ignoring_conflicts(
+            db,
+            Market,
+            ["name", "region"],
+            [{"name": market_data.name, "region": market_data.region}]
         )
-        existing_market = db.exec(statement).first()
-        if existing_market:
+        
+        if not created:
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Market with this name and region already exists"
             )
         
-        # Create new market
-        new_market = Market(
-            name=market_data.name,
-            region=market_data.region
-        )
-        db.add(new_market)
         db.commit()
-        db.refresh(new_market)
         
-        return new_market
+        return created[0]
 
 
 
@@ -2,46 +2,64 @@
 Price service for business logic.
 """
 import logging
-from datetime import date, timedelta
-from sqlmodel import Session, select
-from typing import List, Optional
+import redis
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from sqlmodel import Session, select, text
+from sqlalchemy import column, func, insert, table
+from sqlalchemy.orm import aliased, selectinload
+from typing import Dict, Iterator, List, Optional
 from fastapi import HTTPException, status
 from decimal import Decimal
 
+from cache import redis_client
+from celery_app import celery_app
+from config import settings
+from database import insert_ignoring_conflicts, lazy_load_guard
 from models.price import Price
 from models.crop import Crop
 from models.market import Market
 from models.alert import Alert
-from models.user import User
 from models.notification_log import NotificationLog
 from schemas.price import PriceCreate
 from services.sms_service import sms_service
+from services.validation import validate_crop_and_market_exist
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL materialized view holding the latest price per crop-market
+# with its 7-day change (created by Alembic revision 0004)
+LATEST_PRICES_VIEW = "latest_prices_with_trend"
+
+# Set while a view refresh is scheduled, so a burst of price writes
+# enqueues one refresh; expires on its own if the task is lost
+LATEST_PRICES_REFRESH_KEY = "latest_prices:refresh_pending"
+LATEST_PRICES_REFRESH_KEY_TTL = 300
+
+# Handle on the view's key columns for use in select() joins
+latest_prices_view = table(
+    LATEST_PRICES_VIEW,
+    column("id"),
+    column("crop_id"),
+    column("market_id")
+)
+
+
+def has_latest_prices_view(db: Session) -> bool:
+    """Whether the database backs latest prices with the materialized view."""
+    return db.get_bind().dialect.name == "postgresql"
+
 
 class PriceService:
     """Service for price operations."""
     
     @staticmethod
-    def get_prices(
-        db: Session,
+    def _prices_statement(
         crop_id: Optional[int] = None,
         market_id: Optional[int] = None,
         price_date: Optional[date] = None
-    ) -> List[Price]:
-        """
-        Get prices with optional filters.
-        
-        Args:
-            db: Database session
-            crop_id: Optional crop ID filter
-            market_id: Optional market ID filter
-            price_date: Optional date filter
-            
-        Returns:
-            List of prices matching the filters
-        """
+    ):
+        """Build the filtered, ordered prices query read by stream_prices."""
         statement = select(Price)
         
         # Apply filters
@@ -55,9 +73,33 @@ class PriceService:
             statement = statement.where(Price.price_date == price_date)
         
         # Order by date (newest first), then by crop and market
-        statement = statement.order_by(Price.price_date.desc(), Price.crop_id, Price.market_id)
+        return statement.order_by(Price.price_date.desc(), Price.crop_id, Price.market_id)
+    
+    @staticmethod
+    def stream_prices(
+        db: Session,
+        crop_id: Optional[int] = None,
+        market_id: Optional[int] = None,
+        price_date: Optional[date] = None,
+        batch_size: int = 500
+    ) -> Iterator[Price]:
+        """
+        Iterate over prices with optional filters, fetching rows in batches.
+        On PostgreSQL this uses a server-side cursor, so memory stays bounded
+        by batch_size regardless of the result size.
         
-        return list(db.exec(statement).all())
+        Args:
+            db: Database session
+            crop_id: Optional crop ID filter
+            market_id: Optional market ID filter
+            price_date: Optional date filter
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            Prices matching the filters
+        """
+        statement = PriceService._prices_statement(crop_id, market_id, price_date)
+        yield from db.exec(statement.execution_options(yield_per=batch_size))
     
     @staticmethod
     def get_price_by_id(db: Session, price_id: int) -> Price:
@@ -109,50 +151,41 @@ class PriceService:
         return db.exec(statement).first()
     
     @staticmethod
-    def validate_crop_exists(db: Session, crop_id: int) -> Crop:
+    def get_previous_prices(db: Session, price_ids: List[int]) -> Dict[int, Decimal]:
         """
-        Validate that crop exists.
+        Get the price recorded before each given price for the same crop and
+        market, in one query for the whole batch.
         
         Args:
             db: Database session
-            crop_id: Crop ID
+            price_ids: IDs of the prices to look up
             
         Returns:
-            Crop object
-            
-        Raises:
-            HTTPException: If crop not found
-        """
-        crop = db.get(Crop, crop_id)
-        if not crop:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Crop with ID {crop_id} not found"
-            )
-        return crop
-    
-    @staticmethod
-    def validate_market_exists(db: Session, market_id: int) -> Market:
+            Previous price keyed by price ID; prices without an earlier
+            record are left out
         """
-        Validate that market exists.
+        if not price_ids:
+            return {}
         
-        Args:
-            db: Database session
-            market_id: Market ID
-            
-        Returns:
-            Market object
-            
-        Raises:
-            HTTPException: If market not found
-        """
-        market = db.get(Market, market_id)
-        if not market:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Market with ID {market_id} not found"
+        earlier = aliased(Price)
+        previous_price = (
+            select(earlier.price)
+            .where(
+                earlier.crop_id == Price.crop_id,
+                earlier.market_id == Price.market_id,
+                earlier.price_date < Price.price_date
             )
-        return market
+            .order_by(earlier.price_date.desc())
+            .limit(1)
+            .correlate(Price)
+            .scalar_subquery()
+        )
+        statement = select(Price.id, previous_price).where(Price.id.in_(price_ids))
+        return {
+            price_id: previous
+            for price_id, previous in db.exec(statement)
+            if previous is not None
+        }
     
     @staticmethod
     def create_price(db: Session, price_data: PriceCreate) -> Price:
@@ -170,47 +203,122 @@ class PriceService:
         Raises:
             HTTPException: If duplicate price exists or related entities not found
         """
-        # Validate crop exists
-        PriceService.validate_crop_exists(db, price_data.crop_id)
-        
-        # Validate market exists
-        PriceService.validate_market_exists(db, price_data.market_id)
-        
-        # Check for duplicate (one price per crop per market per day)
-        existing_price = PriceService.check_duplicate_price(
+        validate_crop_and_market_exist(
             db,
             price_data.crop_id,
-            price_data.market_id,
-            price_data.price_date
+            price_data.market_id
         )
         
-        if existing_price:
+        # Insert unless the crop already has a price at this market on this date
+        created = insert_ignoring_conflicts(
+            db,
+            Price,
+            ["crop_id", "market_id", "date"],
+            [price_data.model_dump()]
+        )
+        
+        if not created:
+            db.rollback()
+            existing_price = PriceService.check_duplicate_price(
+                db,
+                price_data.crop_id,
+                price_data.market_id,
+                price_data.price_date
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Price already exists for this crop, market, and date. "
                        f"Use PUT/PATCH to update existing price (ID: {existing_price.id})"
             )
         
-        # Create new price
-        new_price = Price(
-            crop_id=price_data.crop_id,
-            market_id=price_data.market_id,
-            price=price_data.price,
-            price_date=price_data.price_date
-        )
-        db.add(new_price)
+        new_price = created[0]
         db.commit()
-        db.refresh(new_price)
         
-        # Notify users about price change if significant (async, don't block)
-        try:
-            PriceService._notify_price_change(db, new_price)
-        except Exception as e:
-            # Log error but don't fail price creation
-            logger.error(f"Error in price change notification: {str(e)}", exc_info=True)
+        PriceService.schedule_latest_prices_refresh(db)
+        
+        # Notify users about price change if significant in a Celery worker
+        # so the SMS fan-out stays off the request path; skip the broker
+        # entirely when nothing could be sent, and notify inline when the
+        # broker is unreachable so alerts are not silently dropped
+        if sms_service.enabled:
+            try:
+                celery_app.send_task(
+                    "tasks.notify_price_change",
+                    args=[new_price.id],
+                    ignore_result=True
+                )
+            except Exception as e:
+                logger.warning("Could not enqueue price change notification for price %s, notifying inline: %s", new_price.id, e)
+                PriceService.notify_price_change(db, new_price)
         
         return new_price
     
+    @staticmethod
+    def bulk_create_prices(db: Session, prices_data: List[PriceCreate]) -> List[Price]:
+        """
+        Create many prices at once, e.g. from a daily market report.
+        Prices already recorded for their crop, market and date are skipped.
+        
+        Args:
+            db: Database session
+            prices_data: Price creation data
+            
+        Returns:
+            Created prices
+            
+        Raises:
+            HTTPException: If a related crop or market is not found
+        """
+        if not prices_data:
+            return []
+        
+        # Validate every referenced crop and market with one query each
+        crop_ids = {price_data.crop_id for price_data in prices_data}
+        market_ids = {price_data.market_id for price_data in prices_data}
+        missing_crops = crop_ids - set(db.exec(select(Crop.id).where(Crop.id.in_(crop_ids))))
+        if missing_crops:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Crop with ID {min(missing_crops)} not found"
+            )
+        missing_markets = market_ids - set(db.exec(select(Market.id).where(Market.id.in_(market_ids))))
+        if missing_markets:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Market with ID {min(missing_markets)} not found"
+            )
+        
+        new_prices = insert_ignoring_conflicts(
+            db,
+            Price,
+            ["crop_id", "market_id", "date"],
+            [price_data.model_dump() for price_data in prices_data]
+        )
+        db.commit()
+        
+        if not new_prices:
+            return new_prices
+        
+        PriceService.schedule_latest_prices_refresh(db)
+        
+        # One task for the batch, so previous prices are looked up together;
+        # skip the broker entirely when nothing could be sent
+        if sms_service.enabled:
+            price_ids = [price.id for price in new_prices]
+            try:
+                celery_app.send_task(
+                    "tasks.notify_price_changes",
+                    args=[price_ids],
+                    ignore_result=True
+                )
+            except Exception as e:
+                logger.warning("Could not enqueue price change notifications for %d prices, notifying inline: %s", len(new_prices), e)
+                previous_prices = PriceService.get_previous_prices(db, price_ids)
+                for new_price in new_prices:
+                    PriceService.notify_price_change(db, new_price, previous_prices)
+        
+        return new_prices
+    
     @staticmethod
     def get_latest_prices_with_details(db: Session, limit: int = 10) -> List[dict]:
         """
@@ -223,166 +331,281 @@ class PriceService:
         Returns:
             List of dictionaries with price, crop, market, and trend information
         """
-        # Get all prices ordered by date
-        statement = select(Price).order_by(Price.price_date.desc())
-        all_prices = db.exec(statement).all()
+        if has_latest_prices_view(db):
+            rows = db.execute(
+                text(
+                    f"SELECT id, crop_id, market_id, crop_name, crop_type, market_name, market_region, "
+                    f"price, price_date, price_change_7d "
+                    f"FROM {LATEST_PRICES_VIEW} ORDER BY price_date DESC LIMIT :limit"
+                ),
+                {"limit": limit}
+            ).all()
+            return [
+                {
+                    "id": row.id,
+                    "crop_id": row.crop_id,
+                    "market_id": row.market_id,
+                    "crop_name": row.crop_name,
+                    "crop_type": row.crop_type,
+                    "market_name": row.market_name,
+                    "market_region": row.market_region,
+                    "price": float(row.price),
+                    "price_date": row.price_date,
+                    "price_change_7d": float(row.price_change_7d)
+                }
+                for row in rows
+            ]
         
-        # Group by crop-market and get latest for each
-        seen = {}
-        latest_prices = []
+        # Rank each crop-market pair's prices newest first and keep the top
+        # row, with its crop, market and 7-day-prior price, in one query
+        ranked = (
+            select(
+                Price.id,
+                Price.crop_id,
+                Price.market_id,
+                Price.price,
+                Price.price_date.label("price_date"),
+                func.row_number().over(
+                    partition_by=(Price.crop_id, Price.market_id),
+                    order_by=Price.price_date.desc()
+                ).label("rank")
+            )
+            .subquery()
+        )
         
-        for price in all_prices:
-            key = (price.crop_id, price.market_id)
-            if key not in seen:
-                seen[key] = True
-                
-                # Get crop and market details
-                crop = db.get(Crop, price.crop_id)
-                market = db.get(Market, price.market_id)
-                
-                if not crop or not market:
-                    continue
-                
-                # Get previous price for trend calculation (7 days ago)
-                prev_date = price.price_date - timedelta(days=7)
-                prev_statement = (
-                    select(Price)
-                    .where(
-                        Price.crop_id == price.crop_id,
-                        Price.market_id == price.market_id,
-                        Price.price_date <= prev_date
-                    )
-                    .order_by(Price.price_date.desc())
-                    .limit(1)
-                )
-                prev_price_obj = db.exec(prev_statement).first()
-                
-                # Calculate trend
-                change = 0
-                if prev_price_obj:
-                    current_price = float(price.price)
-                    previous_price = float(prev_price_obj.price)
-                    change = current_price - previous_price
-                
-                # Safely get crop_type (handle existing crops without crop_type column)
-                try:
-                    crop_type = crop.crop_type if hasattr(crop, 'crop_type') else 'Grain'
-                except (AttributeError, KeyError):
-                    crop_type = 'Grain'
-                
-                latest_prices.append({
-                    "id": price.id,
-                    "crop_name": crop.name,
-                    "crop_type": crop_type,
-                    "market_name": market.name,
-                    "market_region": market.region,
-                    "price": float(price.price),
-                    "price_date": price.price_date.isoformat(),
-                    "price_change_7d": change
-                })
-                
-                if len(latest_prices) >= limit:
-                    break
+        if db.get_bind().dialect.name == "sqlite":
+            # SQLite stores dates as text and has no date arithmetic operators
+            week_before = func.date(ranked.c.price_date, "-7 days")
+        else:
+            week_before = ranked.c.price_date - timedelta(days=7)
+        previous_price = (
+            select(Price.price)
+            .where(
+                Price.crop_id == ranked.c.crop_id,
+                Price.market_id == ranked.c.market_id,
+                Price.price_date <= week_before
+            )
+            .order_by(Price.price_date.desc())
+            .limit(1)
+            .correlate(ranked)
+            .scalar_subquery()
+        )
+        
+        statement = (
+            select(
+                ranked.c.id,
+                ranked.c.crop_id,
+                ranked.c.market_id,
+                ranked.c.price,
+                ranked.c.price_date,
+                Crop.name.label("crop_name"),
+                Crop.crop_type,
+                Market.name.label("market_name"),
+                Market.region.label("market_region"),
+                previous_price.label("previous_price")
+            )
+            .join(Crop, Crop.id == ranked.c.crop_id)
+            .join(Market, Market.id == ranked.c.market_id)
+            .where(ranked.c.rank == 1)
+            .order_by(ranked.c.price_date.desc())
+            .limit(limit)
+        )
+        
+        latest_prices = []
+        for row in db.exec(statement):
+            # Calculate trend in Decimal; convert once for the response
+            change = 0
+            if row.previous_price is not None:
+                change = float(row.price - row.previous_price)
+            
+            latest_prices.append({
+                "id": row.id,
+                "crop_id": row.crop_id,
+                "market_id": row.market_id,
+                "crop_name": row.crop_name,
+                "crop_type": row.crop_type,
+                "market_name": row.market_name,
+                "market_region": row.market_region,
+                "price": float(row.price),
+                "price_date": row.price_date,
+                "price_change_7d": change
+            })
         
         return latest_prices
     
     @staticmethod
-    def _notify_price_change(db: Session, new_price: Price) -> None:
+    def refresh_latest_prices(db: Session) -> None:
+        """
+        Refresh the latest prices materialized view after prices change.
+        No-op on databases without the view.
+        
+        Args:
+            db: Database session
+        """
+        if not has_latest_prices_view(db):
+            return
+        
+        try:
+            # CONCURRENTLY keeps the view readable while it is rebuilt
+            db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {LATEST_PRICES_VIEW}"))
+            db.commit()
+        except Exception as e:
+            # A stale view is preferable to failing the price write
+            logger.error("Error refreshing %s: %s", LATEST_PRICES_VIEW, e, exc_info=True)
+            db.rollback()
+    
+    @staticmethod
+    def schedule_latest_prices_refresh(db: Session) -> None:
+        """
+        Refresh the latest prices materialized view in a Celery worker after
+        LATEST_PRICES_REFRESH_DELAY seconds, so price writes do not wait for
+        the rebuild and a burst of writes costs one refresh.
+        Refreshes inline when Redis or the broker is unavailable.
+        No-op on databases without the view.
+        
+        Args:
+            db: Database session
+        """
+        if not has_latest_prices_view(db):
+            return
+        
+        try:
+            # Only the first write of a window enqueues; later ones are
+            # picked up by the same refresh
+            if not redis_client.set(
+                LATEST_PRICES_REFRESH_KEY,
+                1,
+                nx=True,
+                ex=settings.LATEST_PRICES_REFRESH_DELAY + LATEST_PRICES_REFRESH_KEY_TTL
+            ):
+                return
+            celery_app.send_task(
+                "tasks.refresh_latest_prices",
+                countdown=settings.LATEST_PRICES_REFRESH_DELAY,
+                ignore_result=True
+            )
+        except Exception as e:
+            logger.warning("Could not schedule %s refresh, refreshing inline: %s", LATEST_PRICES_VIEW, e)
+            try:
+                redis_client.delete(LATEST_PRICES_REFRESH_KEY)
+            except redis.RedisError:
+                pass
+            PriceService.refresh_latest_prices(db)
+    
+    @staticmethod
+    def notify_price_change(
+        db: Session,
+        new_price: Price,
+        previous_prices: Optional[Dict[int, Decimal]] = None
+    ) -> None:
         """
         Notify users about price changes for crops they have alerts on.
         
         Args:
             db: Database session
             new_price: Newly created price record
+            previous_prices: Previous prices keyed by price ID, as returned by
+                get_previous_prices; looked up when not given
         """
         try:
-            # Get all active alerts for this crop-market combination
+            # Nothing can be sent, so skip the alert and price lookups
+            if not sms_service.enabled:
+                logger.debug("SMS disabled; skipping notifications")
+                return
+            
+            # Get previous price (the latest one before this date)
+            if previous_prices is None:
+                previous_prices = PriceService.get_previous_prices(db, [new_price.id])
+            prev_price = previous_prices.get(new_price.id)
+            
+            # Calculate price change percentage (Decimal, as stored)
+            price_change_pct = 0
+            if prev_price is not None and prev_price > 0:
+                price_change_pct = (new_price.price - prev_price) / prev_price * 100
+            
+            # Only notify if price changed by more than 5%
+            if abs(price_change_pct) < 5:
+                return
+            
+            # Get all active alerts for this crop-market combination, with
+            # their users loaded in one follow-up IN query
             alert_statement = (
                 select(Alert)
                 .where(
                     Alert.crop_id == new_price.crop_id,
                     Alert.market_id == new_price.market_id
                 )
+                .options(selectinload(Alert.user), *lazy_load_guard())
             )
             alerts = db.exec(alert_statement).all()
             
             if not alerts:
                 return
             
-            # Get crop and market details
-            crop = db.get(Crop, new_price.crop_id)
-            market = db.get(Market, new_price.market_id)
+            # Get crop and market names in one round trip
+            names = db.exec(
+                select(Crop.name, Market.name)
+                .join(Market, Market.id == new_price.market_id)
+                .where(Crop.id == new_price.crop_id)
+            ).first()
             
-            if not crop or not market:
+            if names is None:
                 return
+            crop_name, market_name = names
             
-            # Get previous price (from yesterday or latest)
-            prev_date = new_price.price_date - timedelta(days=1)
-            prev_statement = (
-                select(Price)
-                .where(
-                    Price.crop_id == new_price.crop_id,
-                    Price.market_id == new_price.market_id,
-                    Price.price_date < new_price.price_date
-                )
-                .order_by(Price.price_date.desc())
-                .limit(1)
+            # Create price change notification message
+            direction = "increased" if price_change_pct > 0 else "decreased"
+            message = (
+                f"Price Update: {crop_name} at {market_name} "
+                f"has {direction} to {new_price.price:.2f} ETB. "
+                f"Change: {abs(price_change_pct):.1f}%"
             )
-            prev_price = db.exec(prev_statement).first()
-            
-            # Calculate price change percentage
-            price_change_pct = 0
-            if prev_price:
-                prev_price_float = float(prev_price.price)
-                new_price_float = float(new_price.price)
-                if prev_price_float > 0:
-                    price_change_pct = ((new_price_float - prev_price_float) / prev_price_float) * 100
             
-            # Only notify if price changed by more than 5%
-            if abs(price_change_pct) < 5:
-                return
+            # Send notifications to users with alerts, concurrently; only
+            # plain values cross into the worker threads
+            recipients = [
+                (alert.user.id, alert.user.phone_number)
+                for alert in alerts
+                if alert.user
+            ]
             
-            # Send notifications to users with alerts
-            for alert in alerts:
-                user = db.get(User, alert.user_id)
-                if not user:
-                    continue
-                
-                # Create price change notification message
-                direction = "increased" if price_change_pct > 0 else "decreased"
-                message = (
-                    f"Price Update: {crop.name} at {market.name} "
-                    f"has {direction} to {new_price.price:.2f} ETB. "
-                    f"Change: {abs(price_change_pct):.1f}%"
-                )
-                
-                # Send SMS
-                success, error = sms_service.send_generic_notification(
-                    to_phone=user.phone_number,
+            def send(phone_number: str):
+                return sms_service.send_generic_notification(
+                    to_phone=phone_number,
                     message=message
                 )
-                
+            
+            max_workers = min(settings.SMS_MAX_WORKERS, len(recipients)) or 1
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(send, [phone for _, phone in recipients]))
+            
+            logs = []
+            for (user_id, _), (success, error) in zip(recipients, results):
                 if success:
-                    # Log notification
-                    notification_log = NotificationLog(
-                        user_id=user.id,
-                        message=message
-                    )
-                    db.add(notification_log)
+                    logs.append({
+                        "user_id": user_id,
+                        "message": message,
+                        "sent_at": datetime.utcnow()
+                    })
                     logger.info(
-                        f"Price change notification sent to user {user.id} "
-                        f"for {crop.name} at {market.name}"
+                        "Price change notification sent to user %s for %s at %s",
+                        user_id, crop_name, market_name
                     )
                 else:
                     logger.error(
-                        f"Failed to send price change notification to user {user.id}: {error}"
+                        "Failed to send price change notification to user %s: %s",
+                        user_id, error
                     )
             
-            db.commit()
+            # Log all sent notifications with a single executemany INSERT
+            if logs:
+                db.execute(insert(NotificationLog), logs)
+                db.commit()
             
         except Exception as e:
             logger.error(
-                f"Error notifying users about price change: {str(e)}",
+                "Error notifying users about price change: %s",
+                e,
                 exc_info=True
             )
             db.rollback()
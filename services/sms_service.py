@@ -2,14 +2,26 @@
 SMS service for sending notifications via Twilio.
 """
 import logging
+import re
+import time
 from typing import Optional, Tuple
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
+from urllib3.util.retry import Retry
 from twilio.base.exceptions import TwilioException, TwilioRestException
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait before the first retry after a rate-limit response;
+# doubled on every further retry
+RATE_LIMIT_BACKOFF = 1.0
+
+# Runs of whitespace, including newlines, collapsed to one space in SMS bodies
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class SMSService:
     """Service for sending SMS messages via Twilio."""
@@ -27,18 +39,36 @@ class SMSService:
             try:
                 self.client = Client(
                     settings.TWILIO_ACCOUNT_SID,
-                    settings.TWILIO_AUTH_TOKEN
+                    settings.TWILIO_AUTH_TOKEN,
+                    http_client=self._build_http_client()
                 )
                 self.enabled = True
                 logger.info("Twilio SMS service initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize Twilio client: {e}")
+                logger.error("Failed to initialize Twilio client: %s", e)
                 self.enabled = False
         else:
             logger.warning(
                 "SMS service disabled: Missing Twilio credentials or SMS_ENABLED=False"
             )
     
+    @staticmethod
+    def _build_http_client() -> TwilioHttpClient:
+        """
+        Build a Twilio HTTP client whose keep-alive pool can hold a
+        connection per concurrent sender, so sends reuse TLS connections.
+        """
+        http_client = TwilioHttpClient(timeout=settings.SMS_TIMEOUT)
+        # Only connection failures are retried; a read timeout may mean the
+        # message was sent, and 429s are backed off in send_sms
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(settings.SMS_MAX_WORKERS, 1),
+            max_retries=Retry(total=2, read=0, status=0, backoff_factor=0.2)
+        )
+        http_client.session.mount("https://", adapter)
+        return http_client
+    
     def format_message(self, message: str, max_length: int = 160) -> str:
         """
         Format message to be SMS-friendly (short and concise).
@@ -51,7 +81,7 @@ class SMSService:
             Formatted message (truncated if necessary)
         """
         # Remove extra whitespace and newlines
-        formatted = " ".join(message.split())
+        formatted = _WHITESPACE_RE.sub(" ", message).strip()
         
         # Truncate if too long
         if len(formatted) > max_length:
@@ -93,32 +123,46 @@ class SMSService:
         formatted_message = self.format_message(message)
         
         try:
-            # Send SMS via Twilio
-            twilio_message = self.client.messages.create(
-                body=formatted_message,
-                from_=settings.TWILIO_PHONE_NUMBER,
-                to=to_phone
-            )
+            # Send SMS via Twilio, backing off while rate limited
+            attempt = 0
+            while True:
+                try:
+                    twilio_message = self.client.messages.create(
+                        body=formatted_message,
+                        from_=settings.TWILIO_PHONE_NUMBER,
+                        to=to_phone
+                    )
+                    break
+                except TwilioRestException as e:
+                    if e.status != 429 or attempt >= settings.SMS_RATE_LIMIT_RETRIES:
+                        raise
+                    delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+                    attempt += 1
+                    logger.warning(
+                        "Twilio rate limit hit sending to %s; retry %d in %.1fs",
+                        to_phone, attempt, delay
+                    )
+                    time.sleep(delay)
             
             logger.info(
-                f"SMS sent successfully to {to_phone}. "
-                f"Twilio SID: {twilio_message.sid}"
+                "SMS sent successfully to %s. Twilio SID: %s",
+                to_phone, twilio_message.sid
             )
             return True, None
             
         except TwilioRestException as e:
             error_msg = f"Twilio API error: {e.msg}"
-            logger.error(f"Failed to send SMS to {to_phone}: {error_msg}")
+            logger.error("Failed to send SMS to %s: %s", to_phone, error_msg)
             return False, error_msg
             
         except TwilioException as e:
             error_msg = f"Twilio error: {str(e)}"
-            logger.error(f"Failed to send SMS to {to_phone}: {error_msg}")
+            logger.error("Failed to send SMS to %s: %s", to_phone, error_msg)
             return False, error_msg
             
         except Exception as e:
             error_msg = f"Unexpected error sending SMS: {str(e)}"
-            logger.error(f"Failed to send SMS to {to_phone}: {error_msg}")
+            logger.error("Failed to send SMS to %s: %s", to_phone, error_msg)
             return False, error_msg
     
     def send_price_alert(
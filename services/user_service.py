@@ -1,12 +1,15 @@
 """
 User service for business logic.
 """
+from datetime import datetime
 from sqlmodel import Session, select
+from sqlalchemy import exists
 from typing import Optional
 from fastapi import HTTPException, status
 
 from models.user import User
 from schemas.user import UserUpdate
+from services.auth_service import AuthService
 from utils.phone import normalize_phone_number
 
 
@@ -53,6 +56,7 @@ class UserService:
             HTTPException: If user not found or phone number already exists
         """
         user = UserService.get_user_by_id(db, user_id)
+        previous_phone = None
         
         # Update phone number if provided
         if user_data.phone_number is not None:
@@ -60,22 +64,25 @@ class UserService:
             
             # Check if phone number is already taken by another user
             if normalized_phone != user.phone_number:
-                statement = select(User).where(User.phone_number == normalized_phone)
-                existing_user = db.exec(statement).first()
-                if existing_user:
+                statement = select(exists().where(User.phone_number == normalized_phone))
+                if db.exec(statement).one():
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Phone number already registered"
                     )
+                previous_phone = user.phone_number
                 user.phone_number = normalized_phone
         
         # Update language if provided
         if user_data.language is not None:
             user.language = user_data.language
         
-        db.add(user)
+        user.updated_at = datetime.utcnow()
         db.commit()
-        db.refresh(user)
+        
+        # Logins with the old number must not resolve to this user
+        if previous_phone is not None:
+            AuthService.invalidate_cached_phone(previous_phone)
         
         return user
 
@@ -0,0 +1,39 @@
+"""
+Validation helpers shared by services.
+"""
+from sqlmodel import Session, select
+from sqlalchemy import exists
+from fastapi import HTTPException, status
+
+from models.crop import Crop
+from models.market import Market
+
+
+def validate_crop_and_market_exist(db: Session, crop_id: int, market_id: int) -> None:
+    """
+    Validate that a crop and a market exist with a single query.
+    
+    Args:
+        db: Database session
+        crop_id: Crop ID
+        market_id: Market ID
+        
+    Raises:
+        HTTPException: If the crop or the market is not found
+    """
+    statement = select(
+        exists().where(Crop.id == crop_id),
+        exists().where(Market.id == market_id)
+    )
+    crop_found, market_found = db.exec(statement).one()
+    
+    if not crop_found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Crop with ID {crop_id} not found"
+        )
+    if not market_found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Market with ID {market_id} not found"
+        )
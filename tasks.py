@@ -2,11 +2,17 @@
 Celery tasks for background processing.
 """
 import logging
-from sqlmodel import Session
+from typing import List
 
+from sqlmodel import select
+
+from cache import ADMIN_STATS_CACHE_KEY, PRICES_CACHE_PREFIX, cache_delete, cache_delete_prefix, redis_client
 from celery_app import celery_app
-from database import engine
+from database import ScopedSession
+from models.price import Price
 from services.alert_checker_service import AlertCheckerService
+from services.price_service import LATEST_PRICES_REFRESH_KEY, PriceService
+from services.sms_service import sms_service
 
 logger = logging.getLogger(__name__)
 
@@ -19,27 +25,97 @@ def check_price_alerts():
     """
     logger.info("Starting price alert check task...")
     
+    # The worker thread's session is reused across tasks; remove() closes
+    # it and returns its connection to the pool between runs
+    db = ScopedSession()
     try:
-        with Session(engine) as db:
-            stats = AlertCheckerService.check_all_alerts(db)
-            logger.info(f"Price alert check completed: {stats}")
-            return stats
+        stats = AlertCheckerService.check_all_alerts(db)
+        logger.info("Price alert check completed: %s", stats)
+        cache_delete(ADMIN_STATS_CACHE_KEY)
+        return stats
     except Exception as e:
-        logger.error(f"Error in check_price_alerts task: {str(e)}", exc_info=True)
+        logger.error("Error in check_price_alerts task: %s", e, exc_info=True)
         raise
+    finally:
+        ScopedSession.remove()
 
 
+@celery_app.task(name="tasks.bootstrap_schema")
+def bootstrap_schema():
+    """
+    Celery task to apply database migrations and seed initial data.
+    Intended as a one-shot job per deploy rather than a periodic task.
+    """
+    from scripts.bootstrap import bootstrap_database
 
+    logger.info("Bootstrapping database schema...")
+    bootstrap_database()
+    logger.info("Database bootstrap completed")
 
 
+@celery_app.task(name="tasks.notify_price_change", ignore_result=True)
+def notify_price_change(price_id: int):
+    """
+    Celery task to text users with alerts on a crop-market about a new price.
+    Enqueued by PriceService.create_price after the price is committed.
 
+    Args:
+        price_id: ID of the newly created price
+    """
+    if not sms_service.enabled:
+        logger.debug("SMS disabled; skipping notifications")
+        return
 
+    db = ScopedSession()
+    try:
+        new_price = db.get(Price, price_id)
+        if new_price is None:
+            logger.warning("Price %s no longer exists, skipping notification", price_id)
+            return
+        PriceService.notify_price_change(db, new_price)
+    finally:
+        ScopedSession.remove()
 
 
+@celery_app.task(name="tasks.notify_price_changes", ignore_result=True)
+def notify_price_changes(price_ids: List[int]):
+    """
+    Celery task to send price-change notifications for a batch of prices.
+    Enqueued by PriceService.bulk_create_prices; previous prices for the
+    whole batch are looked up in one query.
 
+    Args:
+        price_ids: IDs of the newly created prices
+    """
+    if not sms_service.enabled:
+        logger.debug("SMS disabled; skipping notifications")
+        return
 
+    db = ScopedSession()
+    try:
+        new_prices = db.exec(select(Price).where(Price.id.in_(price_ids))).all()
+        previous_prices = PriceService.get_previous_prices(db, price_ids)
+        for new_price in new_prices:
+            PriceService.notify_price_change(db, new_price, previous_prices)
+    finally:
+        ScopedSession.remove()
 
 
+@celery_app.task(name="tasks.refresh_latest_prices", ignore_result=True)
+def refresh_latest_prices():
+    """
+    Celery task to refresh the latest prices materialized view.
+    Scheduled by PriceService.schedule_latest_prices_refresh after price writes.
+    """
+    # Clear the marker first so writes made during the rebuild schedule
+    # another refresh instead of being missed
+    redis_client.delete(LATEST_PRICES_REFRESH_KEY)
 
+    db = ScopedSession()
+    try:
+        PriceService.refresh_latest_prices(db)
+    finally:
+        ScopedSession.remove()
 
-
+    # Cached latest-price responses may have been built from the old view
+    cache_delete_prefix(PRICES_CACHE_PREFIX)
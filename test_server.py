@@ -17,11 +17,14 @@ def test_server():
     print("Testing FastAPI server...")
     print("="*60)
     
+    # One keep-alive connection for every endpoint
+    session = requests.Session()
+    
     for endpoint in endpoints:
         url = f"{base_url}{endpoint}"
         try:
             print(f"\nTesting: {url}")
-            response = requests.get(url, timeout=5)
+            response = session.get(url, timeout=5)
             print(f"  Status: {response.status_code}")
             print(f"  Response: {response.text[:100]}")
         except requests.exceptions.ConnectionError as e:
@@ -33,6 +36,8 @@ def test_server():
         except Exception as e:
             print(f"  ERROR: {type(e).__name__}: {e}")
     
+    session.close()
+    
     print("\n" + "="*60)
     print("Test complete!")
 
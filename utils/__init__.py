@@ -3,6 +3,7 @@ Utility functions package.
 """
 from .jwt import create_access_token, verify_token
 from .password import hash_password, verify_password
+from .otp import claim_otp_cooldown, generate_otp, store_otp, verify_otp
 from .phone import normalize_phone_number, validate_phone_number
 
 __all__ = [
@@ -10,6 +11,10 @@ __all__ = [
     "verify_token",
     "hash_password",
     "verify_password",
+    "claim_otp_cooldown",
+    "generate_otp",
+    "store_otp",
+    "verify_otp",
     "normalize_phone_number",
     "validate_phone_number",
 ]
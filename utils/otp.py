@@ -0,0 +1,128 @@
+"""
+One-time password utilities.
+
+OTPs are short-lived and single-use, so only a SHA-256 digest is kept in
+Redis (with a TTL); bcrypt's deliberately slow hashing is reserved for
+long-lived passwords. Checking and consuming a code happens in one Lua
+script, so a code can be used once even under concurrent logins, and a
+code is discarded after OTP_MAX_ATTEMPTS wrong guesses.
+"""
+import hashlib
+import logging
+import secrets
+
+import redis
+
+from cache import redis_client
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+OTP_KEY_PREFIX = "otp:"
+OTP_FAILURES_KEY_PREFIX = "otp:fail:"
+OTP_COOLDOWN_KEY_PREFIX = "otp:cooldown:"
+
+# Number of digits in an issued OTP
+OTP_LENGTH = 6
+
+# KEYS: code digest, failure counter
+# ARGV: submitted digest, max attempts, counter TTL in seconds
+# Returns 1 and deletes both keys on a match. On a miss, counts the
+# failure and deletes the code once the limit is reached. Lua strings are
+# interned, so the equality check does not leak how much of the digest
+# matched.
+_VERIFY_OTP_SCRIPT = redis_client.register_script("""
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return 0
+end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 1
+end
+local failures = redis.call('INCR', KEYS[2])
+if failures == 1 then
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+end
+if failures >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1], KEYS[2])
+end
+return 0
+""")
+
+
+def _otp_digest(otp: str) -> str:
+    """Hash an OTP for storage and comparison."""
+    return hashlib.sha256(otp.encode("utf-8")).hexdigest()
+
+
+def generate_otp() -> str:
+    """Generate a random numeric OTP from a cryptographically secure source."""
+    return f"{secrets.randbelow(10 ** OTP_LENGTH):0{OTP_LENGTH}d}"
+
+
+def claim_otp_cooldown(phone_number: str) -> bool:
+    """
+    Start the resend cooldown for a phone number.
+    
+    Args:
+        phone_number: Normalized phone number
+    
+    Returns:
+        True if no OTP was issued within OTP_RESEND_COOLDOWN_SECONDS,
+        False if the number is still cooling down
+    """
+    return bool(redis_client.set(
+        f"{OTP_COOLDOWN_KEY_PREFIX}{phone_number}",
+        1,
+        nx=True,
+        ex=settings.OTP_RESEND_COOLDOWN_SECONDS
+    ))
+
+
+def store_otp(phone_number: str, otp: str) -> None:
+    """
+    Store an OTP for a phone number, replacing any previous one and
+    resetting its failed attempts.
+    
+    Args:
+        phone_number: Normalized phone number
+        otp: One-time password sent to the user
+    """
+    pipeline = redis_client.pipeline()
+    pipeline.set(
+        f"{OTP_KEY_PREFIX}{phone_number}",
+        _otp_digest(otp),
+        ex=settings.OTP_TTL_SECONDS
+    )
+    pipeline.delete(f"{OTP_FAILURES_KEY_PREFIX}{phone_number}")
+    pipeline.execute()
+
+
+def verify_otp(phone_number: str, otp: str) -> bool:
+    """
+    Check an OTP and consume it on success.
+    
+    Args:
+        phone_number: Normalized phone number
+        otp: One-time password supplied by the user
+    
+    Returns:
+        True if the OTP matches the stored one, False otherwise
+    """
+    try:
+        matched = _VERIFY_OTP_SCRIPT(
+            keys=[
+                f"{OTP_KEY_PREFIX}{phone_number}",
+                f"{OTP_FAILURES_KEY_PREFIX}{phone_number}",
+            ],
+            args=[
+                _otp_digest(otp),
+                settings.OTP_MAX_ATTEMPTS,
+                settings.OTP_TTL_SECONDS,
+            ]
+        )
+        return matched == 1
+    except redis.RedisError as e:
+        logger.warning("OTP lookup failed for %s: %s", phone_number, e)
+        return False
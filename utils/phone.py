@@ -2,9 +2,14 @@
 Phone number utility functions.
 """
 import re
+from functools import lru_cache
 from typing import Optional
 
+# Everything except digits and "+"
+_NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
 
+
+@lru_cache(maxsize=10_000)
 def normalize_phone_number(phone: str) -> str:
     """
     Normalize phone number to +251 format.
@@ -25,7 +30,7 @@ def normalize_phone_number(phone: str) -> str:
         ValueError: If phone number format is invalid
     """
     # Remove all non-digit characters except +
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _NON_PHONE_CHARS_RE.sub('', phone)
     
     # Remove leading + if present
     if cleaned.startswith('+'):